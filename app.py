@@ -8,7 +8,7 @@ import json
 import os
 from config import Config
 from models import EODReport, SubmissionTracker, EODTracker
-from slack_bot import SlackBot
+from slack_bot import get_bot
 from firebase_client import FirebaseClient
 from google.cloud import firestore
 from zoneinfo import ZoneInfo
@@ -124,8 +124,7 @@ firebase_client = FirebaseClient() if Config.firebase_config_valid() else None
 try:
     slack_bot = None
     if Config.SLACK_BOT_TOKEN:
-        slack_bot = SlackBot()
-        slack_bot.client.token = Config.SLACK_BOT_TOKEN
+        slack_bot = get_bot()
         logger.info("SlackBot initialized successfully")
 except Exception as e:
     logger.error(f"Failed to initialize SlackBot: {str(e)}")
@@ -175,7 +174,8 @@ def dashboard_data():
         today = now.date()
         
         # Get all active users
-        users_query = firebase_client.db.collection('users').where('status', '==', 'active').stream()
+        users_query = firebase_client.db.collection('users')\
+            .select(['slack_id']).where('status', '==', 'active').stream()
         total_users = 0
         for _ in users_query:
             total_users += 1
@@ -698,8 +698,7 @@ def user_profile(user_id):
     """View user profile with submission history"""
     try:
         # Get Slack bot and Firebase client
-        slack_bot = SlackBot()
-        slack_bot.client.token = Config.SLACK_BOT_TOKEN
+        slack_bot = get_bot()
         firebase_client = FirebaseClient()
         
         # Get user profile data
@@ -974,7 +973,8 @@ def get_stats(date_range):
                 return jsonify({'error': 'Invalid date range'}), 400
         
         # Get all users
-        users_query = firebase_client.db.collection('users').where('status', '==', 'active').stream()
+        users_query = firebase_client.db.collection('users')\
+            .select(['slack_id']).where('status', '==', 'active').stream()
         total_users = 0
         for _ in users_query:
             total_users += 1
@@ -1068,7 +1068,8 @@ def get_specific_date_stats(date_str):
             return jsonify({'error': 'Invalid date format. Use YYYY-MM-DD'}), 400
         
         # Get all users
-        users_query = firebase_client.db.collection('users').where('status', '==', 'active').stream()
+        users_query = firebase_client.db.collection('users')\
+            .select(['slack_id']).where('status', '==', 'active').stream()
         total_users = 0
         for _ in users_query:
             total_users += 1
@@ -1138,8 +1139,7 @@ def send_reminder():
             return jsonify({'success': False, 'error': 'Missing user_id'}), 400
             
         # Send reminder
-        slack_bot = SlackBot()
-        slack_bot.client.token = Config.SLACK_BOT_TOKEN
+        slack_bot = get_bot()
         slack_bot.send_reminder(user_id)
         
         # Record that a reminder was sent
@@ -1320,10 +1320,32 @@ def api_team_members():
             user_id = data.get('user_id')
             if user_id:
                 all_eod_submitters.add(user_id)
-        
-        # Get all active users
+
+        # One 30-day query for the whole roster instead of one per user:
+        # build a map of user_id -> set of NY submission dates up front
+        thirty_days_ago = today - timedelta(days=30)
+        thirty_days_ago_start = datetime.combine(thirty_days_ago, datetime.min.time()).replace(tzinfo=ZoneInfo("America/New_York"))
+        thirty_days_ago_start_utc = thirty_days_ago_start.astimezone(ZoneInfo("UTC"))
+
+        past_by_user = {}
+        past_docs = firebase_client.db.collection('eod_reports')\
+            .select(['user_id', 'timestamp'])\
+            .where(filter=firestore.FieldFilter('timestamp', '>=', thirty_days_ago_start_utc))\
+            .stream()
+
+        for doc in past_docs:
+            doc_data = doc.to_dict()
+            past_user_id = doc_data.get('user_id')
+            timestamp = doc_data.get('timestamp')
+            if past_user_id and timestamp:
+                submission_date = timestamp.astimezone(ZoneInfo("America/New_York")).date()
+                past_by_user.setdefault(past_user_id, set()).add(submission_date)
+
+        # Get all active users, projected to the fields the dashboard shows
         users_data = {}
-        users_query = firebase_client.db.collection('users').where('status', '==', 'active').stream()
+        users_query = firebase_client.db.collection('users')\
+            .select(['slack_id', 'name', 'display_name', 'image', 'email', 'title', 'timezone'])\
+            .where('status', '==', 'active').stream()
         
         for doc in users_query:
             user_data = doc.to_dict()
@@ -1340,26 +1362,9 @@ def api_team_members():
             # Calculate missed days
             missed = 0
             try:
-                # Get submissions from the past 30 days (similar to the non-submission report logic)
-                thirty_days_ago = today - timedelta(days=30)
-                thirty_days_ago_start = datetime.combine(thirty_days_ago, datetime.min.time()).replace(tzinfo=ZoneInfo("America/New_York"))
-                thirty_days_ago_start_utc = thirty_days_ago_start.astimezone(ZoneInfo("UTC"))
-                
-                # Get user's past submissions
-                past_submissions = set()
-                past_docs = firebase_client.db.collection('eod_reports')\
-                    .where('user_id', '==', user_id)\
-                    .where('timestamp', '>=', thirty_days_ago_start_utc)\
-                    .stream()
-                
-                for doc in past_docs:
-                    doc_data = doc.to_dict()
-                    timestamp = doc_data.get('timestamp')
-                    if timestamp:
-                        # Convert timestamp to NY date
-                        submission_date = timestamp.astimezone(ZoneInfo("America/New_York")).date()
-                        past_submissions.add(submission_date)
-                
+                # Look up the user's past submissions from the shared map
+                past_submissions = past_by_user.get(user_id, set())
+
                 # Calculate consecutive missed days (similar to non-submission report)
                 # Start from yesterday and go backwards
                 check_date = today - timedelta(days=1)
@@ -1447,26 +1452,31 @@ def recent_reports():
         has_more = len(docs) > limit
         if has_more:
             docs = docs[:limit]  # Remove the extra document
-            
+
+        # Preload the roster once instead of one users query per report
+        users_by_slack_id = {}
+        try:
+            user_docs = firebase_client.db.collection('users')\
+                .select(['slack_id', 'name', 'image']).stream()
+            for u_doc in user_docs:
+                user_data = u_doc.to_dict()
+                slack_id = user_data.get('slack_id')
+                if slack_id:
+                    users_by_slack_id[slack_id] = user_data
+        except Exception as e:
+            logger.error(f"Error getting user data: {str(e)}")
+
         # Process reports
         reports = []
         for doc in docs:
             data = doc.to_dict()
             user_id = data.get('user_id')
-            
+
             # Get user info
-            user_name = "Unknown User"
-            user_image = ""
-            
-            try:
-                user_doc = firebase_client.db.collection('users').where('slack_id', '==', user_id).limit(1).stream()
-                for u_doc in user_doc:
-                    user_data = u_doc.to_dict()
-                    user_name = user_data.get('name', 'Unknown User')
-                    user_image = user_data.get('image', '')
-            except Exception as e:
-                logger.error(f"Error getting user data: {str(e)}")
-            
+            user_data = users_by_slack_id.get(user_id, {})
+            user_name = user_data.get('name', 'Unknown User')
+            user_image = user_data.get('image', '')
+
             timestamp = data.get('timestamp')
             if timestamp:
                 if isinstance(timestamp, datetime):
@@ -1603,9 +1613,8 @@ def api_missed_submissions(days=30):
             if not user_id or user_id == 'USLACKBOT':
                 continue
             
-            # Initialize SlackBot for user profile data
-            slack_bot = SlackBot()
-            slack_bot.client.token = Config.SLACK_BOT_TOKEN
+            # Shared SlackBot for user profile data
+            slack_bot = get_bot()
             
             # Get current year
             current_year = today.year
@@ -13,6 +13,10 @@ class FirebaseClient:
     def __init__(self):
         """Initialize Firebase client with proper error handling"""
         self.db = None
+        # Per-process memo of users already verified/created and submitters
+        # already recorded, so repeat submissions skip those round-trips
+        self._known_users = set()
+        self._recorded_submitters = set()
         try:
             if not firebase_admin._apps:
                 if not Config.firebase_config_valid():
@@ -107,10 +111,14 @@ class FirebaseClient:
                 report_data['user_name'] = 'Unknown'
                 report_data['user_email'] = 'Unknown'
             
-            # Add timestamp and user_id
+            # Add timestamp and user_id. The denormalized date field is the
+            # New York calendar day - everything downstream (tracker, reports)
+            # buckets by NY date, and a UTC date would land evening
+            # submissions on the next day
             report_data['timestamp'] = datetime.now(tz=ZoneInfo("UTC"))
             report_data['user_id'] = user_id
-            report_data['date'] = report_data['timestamp'].strftime('%Y-%m-%d')
+            report_data['date'] = report_data['timestamp'].astimezone(
+                ZoneInfo("America/New_York")).strftime('%Y-%m-%d')
             
             # Save to Firestore
             doc_ref = self.db.collection('eod_reports').document()
@@ -118,7 +126,11 @@ class FirebaseClient:
             
             # Auto-add user to users collection if not already exists
             self._ensure_user_exists(user_id, report_data['user_name'], report_data['user_email'])
-            
+
+            # Keep the distinct-submitters materialized view current (doc ID
+            # is the user ID, so repeat submits are idempotent upserts)
+            self._record_distinct_submitter(user_id)
+
             logger.info(f"Successfully saved EOD report for user {user_id} ({report_data['user_name']})")
             return doc_ref.id
             
@@ -129,11 +141,17 @@ class FirebaseClient:
     def _ensure_user_exists(self, slack_id, name, email):
         """Ensure user exists in the users collection"""
         try:
+            # Existence is sticky, so one verification per process is
+            # enough; repeat submitters skip the query entirely
+            if slack_id in self._known_users:
+                return
+
             # Check if user already exists
             users_ref = self.db.collection('users')
-            query = users_ref.where('slack_id', '==', slack_id).limit(1)
+            query = users_ref.select(['slack_id'])\
+                .where('slack_id', '==', slack_id).limit(1)
             existing_users = list(query.stream())
-            
+
             if not existing_users:
                 # User doesn't exist, create new user
                 new_user = {
@@ -147,12 +165,87 @@ class FirebaseClient:
                 
                 users_ref.document().set(new_user)
                 logger.info(f"Auto-added new user: {name} ({slack_id})")
-                
+
+            self._known_users.add(slack_id)
+
         except Exception as e:
             logger.error(f"Error ensuring user exists: {str(e)}")
             # Don't raise the exception - we don't want to block the EOD submission
             # if there's an issue with user management
 
+    def _record_distinct_submitter(self, user_id):
+        """Upsert a user into the distinct_submitters materialized view"""
+        try:
+            # The upsert is idempotent; once it has succeeded in this
+            # process there is nothing new to write for repeat submissions
+            if user_id in self._recorded_submitters:
+                return
+            self.db.collection('distinct_submitters').document(user_id).set(
+                {'first_seen': firestore.SERVER_TIMESTAMP}, merge=True
+            )
+            self._recorded_submitters.add(user_id)
+        except Exception as e:
+            logger.error(f"Error recording distinct submitter: {str(e)}")
+            # Don't raise - the view can be rebuilt with
+            # migrate_distinct_submitters, so never block a submission
+
+    def migrate_distinct_submitters(self):
+        """One-time backfill of the distinct_submitters collection.
+
+        Streams historical reports with a user_id projection, dedupes in
+        Python, and writes one tiny doc per submitter in batches (Firestore
+        caps a batch at 500 writes). Safe to re-run; writes are idempotent.
+        """
+        if not self.db:
+            logger.error("Firebase client not initialized")
+            return 0
+
+        try:
+            docs = self.db.collection('eod_reports').select(['user_id']).stream()
+            distinct = {doc.get('user_id') for doc in docs if doc.get('user_id')}
+
+            batch = self.db.batch()
+            pending = 0
+            for user_id in distinct:
+                batch.set(
+                    self.db.collection('distinct_submitters').document(user_id),
+                    {'first_seen': firestore.SERVER_TIMESTAMP}, merge=True
+                )
+                pending += 1
+                if pending == 499:
+                    batch.commit()
+                    batch = self.db.batch()
+                    pending = 0
+            if pending:
+                batch.commit()
+
+            logger.info(f"Migrated {len(distinct)} distinct submitters")
+            return len(distinct)
+        except Exception as e:
+            logger.error(f"Error migrating distinct submitters: {str(e)}")
+            return 0
+
+    def get_distinct_submitters(self):
+        """Get the set of user IDs that have ever submitted an EOD report"""
+        if not self.db:
+            logger.error("Firebase client not initialized")
+            return set()
+
+        try:
+            # Prefer the materialized view: one doc per submitter instead of
+            # one projected doc per report
+            submitters = {doc.id for doc in self.db.collection('distinct_submitters').stream()}
+            if submitters:
+                return submitters
+
+            # View not populated yet (migration hasn't run) - fall back to a
+            # projected scan over the reports
+            docs = self.db.collection('eod_reports').select(['user_id']).stream()
+            return {doc.get('user_id') for doc in docs if doc.get('user_id')}
+        except Exception as e:
+            logger.error(f"Error getting distinct submitters: {str(e)}")
+            return set()
+
     def get_user_reports(self, user_id, date=None):
         """Get EOD reports for a specific user"""
         if not self.db:
@@ -196,6 +289,36 @@ class FirebaseClient:
             logger.error(f"Error saving tracker: {str(e)}")
             return None
 
+    def save_trackers(self, tracker_rows):
+        """Save multiple submission trackers in batched writes.
+
+        Firestore commits a batch as one round-trip (max 500 writes), so a
+        per-user fanout costs ceil(N/499) requests instead of N.
+        """
+        if not self.db:
+            logger.error("Firebase client not initialized")
+            return 0
+
+        try:
+            batch = self.db.batch()
+            pending = 0
+            saved = 0
+            for tracker_data in tracker_rows:
+                batch.set(self.db.collection('submission_trackers').document(),
+                          tracker_data)
+                pending += 1
+                saved += 1
+                if pending == 499:
+                    batch.commit()
+                    batch = self.db.batch()
+                    pending = 0
+            if pending:
+                batch.commit()
+            return saved
+        except Exception as e:
+            logger.error(f"Error saving trackers: {str(e)}")
+            return 0
+
     def get_tracker(self, user_id, date):
         """Get tracker for a specific user and date"""
         if not self.db:
@@ -365,9 +488,10 @@ class FirebaseClient:
     def _get_active_users(self):
         """Get all active users from Firestore"""
         try:
-            # Query users collection for active users
+            # Query users collection for active users; only slack_id is used
             users_ref = self.db.collection('users')
-            active_users = users_ref.where('status', '==', 'active').stream()
+            active_users = users_ref.select(['slack_id'])\
+                .where('status', '==', 'active').stream()
             
             # Extract user IDs
             user_ids = [doc.get('slack_id') for doc in active_users 
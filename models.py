@@ -1,8 +1,27 @@
 from datetime import datetime
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+# Section headers recognized by EODReport.create_from_text: one anchored
+# match per line replaces the chain of lower().startswith() checks
+_SECTION_RE = re.compile(
+    r'(short-term|long-term|accomplishments|blockers|goals|client):',
+    re.IGNORECASE)
+
+_SECTION_FIELDS = {
+    'short-term': 'short_term_projects',
+    'long-term': 'long_term_projects',
+    'accomplishments': 'accomplishments',
+    'blockers': 'blockers',
+    'goals': 'next_day_goals',
+    'client': 'client_interactions',
+}
+
+# Fields stored as {index: line} dicts rather than joined text
+_DICT_FIELDS = frozenset({'short_term_projects', 'long_term_projects'})
+
 class EODReport:
     def __init__(self, user_id, short_term_projects=None, long_term_projects=None,
                  accomplishments=None, blockers=None, next_day_goals=None,
@@ -22,40 +41,29 @@ class EODReport:
     @classmethod
     def create_from_text(cls, user_id, text):
         """Parse EOD report text and create report object"""
-        lines = text.split('\n')
-        data = {
-            'short_term_projects': {},
-            'long_term_projects': {},
-            'accomplishments': '',
-            'blockers': '',
-            'next_day_goals': '',
-            'client_interactions': ''
-        }
-        
-        current_section = None
-        for line in lines:
+        # One anchored regex match per line instead of six startswith
+        # probes; body lines collect into lists and are assembled once
+        # at the end, so multi-line sections are kept in full
+        buckets = {field: [] for field in _SECTION_FIELDS.values()}
+
+        current_field = None
+        for line in text.split('\n'):
             line = line.strip()
             if not line:
                 continue
-                
-            if line.lower().startswith('short-term:'):
-                current_section = 'short_term_projects'
-            elif line.lower().startswith('long-term:'):
-                current_section = 'long_term_projects'
-            elif line.lower().startswith('accomplishments:'):
-                current_section = 'accomplishments'
-            elif line.lower().startswith('blockers:'):
-                current_section = 'blockers'
-            elif line.lower().startswith('goals:'):
-                current_section = 'next_day_goals'
-            elif line.lower().startswith('client:'):
-                current_section = 'client_interactions'
-            elif current_section:
-                if isinstance(data[current_section], dict):
-                    data[current_section][len(data[current_section])] = line
-                else:
-                    data[current_section] = line
-        
+
+            match = _SECTION_RE.match(line)
+            if match:
+                current_field = _SECTION_FIELDS[match.group(1).lower()]
+            elif current_field:
+                buckets[current_field].append(line)
+
+        data = {
+            field: ({i: item for i, item in enumerate(lines)}
+                    if field in _DICT_FIELDS else '\n'.join(lines))
+            for field, lines in buckets.items()
+        }
+
         return cls(
             user_id=user_id,
             short_term_projects=data['short_term_projects'],
@@ -1,7 +1,14 @@
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.executors.pool import ThreadPoolExecutor as APSThreadPoolExecutor
 from apscheduler.triggers.cron import CronTrigger
 from datetime import datetime, timedelta, date
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+import functools
 import logging
+import random
+import threading
+import time
 from models import EODReport, SubmissionTracker
 from sheets_client import SheetsClient
 from config import Config
@@ -9,15 +16,38 @@ from zoneinfo import ZoneInfo
 import traceback
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.date import DateTrigger
+from slack_sdk.errors import SlackApiError
+from google.cloud import firestore
 
 logger = logging.getLogger(__name__)
 
+# Shared timezone objects so the jobs stop re-resolving the tz database
+# string on every datetime.now()/astimezone() call
+_NY = ZoneInfo("America/New_York")
+_UTC = ZoneInfo("UTC")
+
 # Single user to receive all notifications
 TARGET_USER_ID = "U083K838X8V"  # Harlan's user ID
 
 # Management channel for reports
 MANAGEMENT_CHANNEL = "C08MD128A80"  # Private channel for management reports
 
+# Internal team user IDs excluded from prompts, reminders, and reports
+INTERNAL_TEAM_IDS = frozenset({
+    "U083K838X8V",  # Harlan
+    "U0890AG4ZEU",
+    "U0837HZE98X",
+    "U08CSFHTJ2X",
+    "USLACKBOT"     # Exclude Slackbot
+})
+
+# Messages for the three daily notification passes
+EOD_PROMPT_MSG = ("🔔 *Daily EOD Reminder*\n"
+                  "Please submit your End-of-Day report using the `/eod` command.")
+REMINDER_MSG = "⏰ *Reminder*: Please submit your EOD report for today using the `/eod` command."
+LAST_CALL_MSG = ("🚨 *Last Call*\nYou haven't submitted your EOD report for today. "
+                 "Please submit it in the next 30 minutes before the daily report is sent to management.")
+
 # Define holidays
 HOLIDAYS = {
     date(2024, 1, 1): "New Year's Day",
@@ -30,51 +60,301 @@ HOLIDAYS = {
     date(2024, 12, 30): "Rizal Day"
 }
 
+# Frozen view of the holiday dates for membership tests on hot paths
+HOLIDAY_DATES = frozenset(HOLIDAYS)
+
+def today_utc_window(day):
+    """Return the (start_utc, end_utc) bounds of a New York calendar day.
+
+    Firestore stores timestamps in UTC, so every today-window query needs the
+    NY day converted to a UTC range; this keeps that dance in one place.
+    """
+    start = datetime.combine(day, datetime.min.time()).replace(tzinfo=_NY)
+    end = datetime.combine(day, datetime.max.time()).replace(tzinfo=_NY)
+    return start.astimezone(_UTC), end.astimezone(_UTC)
+
+# Cache of the Slack workspace directory. The 4 PM prompt, 6 PM and 7:30 PM
+# reminders, and the 8 PM management report each need the full member list, so
+# they share one users.list fetch instead of four within the same window.
+_users_cache = {"ts": 0.0, "members": None, "by_id": {}}
+
+def _get_workspace_users(slack_bot, ttl=600):
+    """Get all workspace users from Slack, cached for `ttl` seconds.
+
+    Returns a tuple of (members, by_id) where members is the raw list from
+    users.list and by_id maps user ID to the user dict, so callers can do
+    dict lookups instead of one users_info call per user.
+    """
+    now = time.monotonic()
+    if _users_cache["members"] is not None and now - _users_cache["ts"] < ttl:
+        return _users_cache["members"], _users_cache["by_id"]
+
+    # users.list is Tier 2 rate-limited, so paginate with an explicit limit
+    # and honor Retry-After instead of letting a single 429 fail all the jobs
+    members = []
+    cursor = None
+    while True:
+        try:
+            response = slack_bot.client.users_list(limit=200, cursor=cursor)
+        except SlackApiError as e:
+            if e.response.status_code == 429:
+                retry_after = int(e.response.headers.get("Retry-After", 1))
+                logger.warning(f"users.list rate limited, retrying in {retry_after}s")
+                time.sleep(retry_after)
+                continue
+            raise
+
+        members.extend(response["members"])
+        cursor = response.get("response_metadata", {}).get("next_cursor")
+        if not cursor:
+            break
+        # Stay at ~1 request/sec between pages to avoid tripping the limit
+        time.sleep(1.0)
+
+    _users_cache["ts"] = now
+    _users_cache["members"] = members
+    _users_cache["by_id"] = {u["id"]: u for u in members if u.get("id")}
+
+    return members, _users_cache["by_id"]
+
+# Today's submitters, cached so notification passes that run close together
+# share one Firestore query. Reset whenever the New York date changes.
+_today_cache = {"date": None, "ts": 0.0, "users": None}
+
+def _get_submitted_today(firebase_client, now, ttl=900):
+    """Get the set of user IDs that have submitted today, cached for `ttl` seconds."""
+    today = now.date()
+    if (_today_cache["users"] is not None
+            and _today_cache["date"] == today
+            and time.monotonic() - _today_cache["ts"] < ttl):
+        return _today_cache["users"]
+
+    start_utc, end_utc = today_utc_window(today)
+
+    # Projected query - only user_id comes back per doc
+    submitted_users = set()
+    today_docs = firebase_client.db.collection('eod_reports')\
+        .select(['user_id'])\
+        .where(filter=firestore.FieldFilter('timestamp', '>=', start_utc))\
+        .where(filter=firestore.FieldFilter('timestamp', '<=', end_utc))\
+        .stream()
+    for doc in today_docs:
+        user_id = doc.to_dict().get('user_id')
+        if user_id:
+            submitted_users.add(user_id)
+
+    _today_cache["date"] = today
+    _today_cache["ts"] = time.monotonic()
+    _today_cache["users"] = submitted_users
+    return submitted_users
+
+def skip_on_holiday(fn):
+    """Skip a scheduled job entirely when today is a company holiday.
+
+    Weekends are already excluded at the trigger level (day_of_week='mon-fri'),
+    so this is the only calendar check the jobs themselves need.
+    """
+    @functools.wraps(fn)
+    def wrapper(app, *args, **kwargs):
+        today = datetime.now(_NY).date()
+        if today in HOLIDAY_DATES:
+            logger.info(f"Skipping {fn.__name__} for holiday: {HOLIDAYS[today]}")
+            return
+        return fn(app, *args, **kwargs)
+    return wrapper
+
+# Global pacing for reminder DMs: Slack allows roughly one chat.postMessage
+# per second, so worker threads take turns claiming the next send slot while
+# their HTTP round-trips overlap.
+_send_slot_lock = threading.Lock()
+_send_slot = {"next_ts": 0.0}
+
+def _wait_for_send_slot(interval=1.0):
+    """Block until the next global send slot (~1 DM/sec across all threads)."""
+    with _send_slot_lock:
+        now = time.monotonic()
+        wait = _send_slot["next_ts"] - now
+        _send_slot["next_ts"] = max(now, _send_slot["next_ts"]) + interval
+    if wait > 0:
+        time.sleep(wait)
+
+def _send_message_batch(slack_bot, user_ids, message, max_workers=4):
+    """Send `message` to each user in `user_ids` with overlapped round-trips.
+
+    Sends are paced to ~1 DM/sec overall so the fanout stays inside Slack's
+    chat.postMessage limit, but the HTTP latency of each send no longer
+    serializes the whole loop. Slack API errors are retried up to 5 times
+    per user - honoring Retry-After on 429, exponential backoff with jitter
+    otherwise - so a transient throttle doesn't silently drop a reminder.
+    Returns (sent_count, failed_users).
+    """
+    if not user_ids:
+        return 0, []
+
+    def _send(user_id):
+        delay = 1.0
+        for attempt in range(1, 6):
+            _wait_for_send_slot()
+            try:
+                slack_bot.client.chat_postMessage(channel=user_id, text=message)
+                return True
+            except SlackApiError as e:
+                if attempt == 5:
+                    logger.error(f"Giving up on message to {user_id} after {attempt} attempts: {str(e)}")
+                    return False
+                if e.response.status_code == 429:
+                    retry_after = int(e.response.headers.get("Retry-After", 1))
+                    logger.warning(f"Rate limited sending to {user_id}, retrying in {retry_after}s")
+                    time.sleep(retry_after)
+                else:
+                    time.sleep(delay + random.uniform(0, delay))
+                    delay = min(delay * 2, 60.0)
+            except Exception as e:
+                logger.error(f"Error sending message to {user_id}: {str(e)}")
+                return False
+        return False
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(_send, user_ids))
+    failed_users = [uid for uid, ok in zip(user_ids, results) if not ok]
+    return sum(results), failed_users
+
+def _notify_unsubmitted(app, message, job_name, slack_bot=None, firebase_client=None):
+    """Send `message` to every active external user who hasn't submitted today.
+
+    Shared body of the EOD prompt, reminder, and last-call jobs, which only
+    differ in the message they send. The clients are normally bound once at
+    scheduler setup; the import is only a fallback for direct callers.
+    """
+    with app.app_context():
+        try:
+            if slack_bot is None or firebase_client is None:
+                from app import slack_bot, firebase_client
+
+            # Check if Firebase client is initialized
+            if not firebase_client:
+                logger.error(f"Firebase client not initialized. Cannot send {job_name}.")
+                return
+
+            now = datetime.now(_NY)
+
+            # Get users who have submitted today
+            submitted_users = set()
+            try:
+                submitted_users = _get_submitted_today(firebase_client, now)
+                logger.info(f"Found {len(submitted_users)} users who have already submitted today")
+            except Exception as e:
+                logger.error(f"Error getting submitted users: {str(e)}")
+
+            # Get all users from Slack (shared cache across the daily jobs)
+            all_users = []
+            try:
+                all_users, _ = _get_workspace_users(slack_bot)
+                logger.info(f"Retrieved {len(all_users)} users from Slack")
+            except Exception as e:
+                logger.error(f"Error getting users from Slack: {str(e)}")
+                return
+
+            # Collect all active users except internal team, bots, deactivated
+            # accounts, and those who already submitted, then send as a batch.
+            # Per-user decisions are tallied into counters rather than logged
+            # individually - one workspace-sized loop was emitting thousands
+            # of log records per cron tick
+            recipients = []
+            skipped_internal = skipped_bot = skipped_deleted = skipped_submitted = 0
+            for user in all_users:
+                user_id = user.get("id")
+
+                if user_id in INTERNAL_TEAM_IDS:
+                    skipped_internal += 1
+                    continue
+
+                if user.get("is_bot", False):
+                    skipped_bot += 1
+                    continue
+
+                if user.get("deleted", False):
+                    skipped_deleted += 1
+                    continue
+
+                if user_id in submitted_users:
+                    skipped_submitted += 1
+                    continue
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Queueing {job_name} for user {user_id}")
+                recipients.append(user_id)
+
+            sent_count, failed_users = _send_message_batch(slack_bot, recipients, message)
+            logger.info(
+                "%s fanout: sent=%d of %d failed=%d skipped_internal=%d bot=%d deleted=%d submitted=%d",
+                job_name, sent_count, len(recipients), len(failed_users),
+                skipped_internal, skipped_bot, skipped_deleted, skipped_submitted
+            )
+            if failed_users:
+                logger.error(f"Failed to send {job_name} to: {failed_users}")
+
+        except Exception as e:
+            logger.error(f"Error sending {job_name}: {str(e)}")
+            logger.error(traceback.format_exc())
+
 def setup_scheduler(app):
     """Initialize and start the scheduler"""
-    scheduler = BackgroundScheduler()
-    
+    # Explicit executor and job defaults: a 20-thread pool so a long 8 PM
+    # report can't starve the 9 PM sheets update, max_instances=1 so a slow
+    # run of a job never overlaps its next fire, and a 5-minute misfire grace
+    # window (coalesced) so a busy host doesn't silently skip a run
+    scheduler = BackgroundScheduler(
+        executors={'default': APSThreadPoolExecutor(20)},
+        job_defaults={
+            'coalesce': True,
+            'max_instances': 1,
+            'misfire_grace_time': 300
+        },
+        timezone=_NY
+    )
+
     # Calculate a time 30 seconds from now for initial run
     now = datetime.now()
     initial_run_time = now + timedelta(seconds=30)
-    
-    # Send EOD prompts at 4:00 PM ET
+
+    # Resolve the shared clients once here instead of each job re-importing
+    # app on every cron fire; the jobs keep an import fallback for direct calls
+    from app import slack_bot, firebase_client
+    clients = {'slack_bot': slack_bot, 'firebase_client': firebase_client}
+
+    # Send EOD prompts at 4:00 PM ET on weekdays
     scheduler.add_job(
-        send_eod_prompts,
-        CronTrigger(hour=16, minute=0, timezone="America/New_York"),
-        args=[app],
+        functools.partial(send_eod_prompts, app, **clients),
+        CronTrigger(day_of_week='mon-fri', hour=16, minute=0, timezone="America/New_York"),
         id='eod_prompts'
     )
-    
-    # Send reminders at 6:00 PM ET
+
+    # Send reminders at 6:00 PM ET on weekdays
     scheduler.add_job(
-        send_reminders,
-        CronTrigger(hour=18, minute=0, timezone="America/New_York"),
-        args=[app],
+        functools.partial(send_reminders, app, **clients),
+        CronTrigger(day_of_week='mon-fri', hour=18, minute=0, timezone="America/New_York"),
         id='reminders'
     )
-    
-    # Send final reminders at 7:30 PM ET
+
+    # Send final reminders at 7:30 PM ET on weekdays
     scheduler.add_job(
-        send_final_reminders,
-        CronTrigger(hour=19, minute=30, timezone="America/New_York"),
-        args=[app],
+        functools.partial(send_final_reminders, app, **clients),
+        CronTrigger(day_of_week='mon-fri', hour=19, minute=30, timezone="America/New_York"),
         id='last_call_reminders'
     )
-    
-    # Send management report at 8:00 PM ET
+
+    # Send management report at 8:00 PM ET on weekdays
     scheduler.add_job(
-        send_daily_non_submission_report,
-        CronTrigger(hour=20, minute=0, timezone="America/New_York"),
-        args=[app],
+        functools.partial(send_daily_non_submission_report, app, **clients),
+        CronTrigger(day_of_week='mon-fri', hour=20, minute=0, timezone="America/New_York"),
         id='daily_non_submission_report'
     )
-    
+
     # Weekly Summary every Friday at 5:00 PM ET
     scheduler.add_job(
-        generate_weekly_summary,
+        functools.partial(generate_weekly_summary, app, slack_bot=slack_bot),
         CronTrigger(day_of_week='fri', hour=17, minute=0, timezone="America/New_York"),
-        args=[app],
         id='weekly_summary'
     )
     
@@ -92,433 +372,85 @@ def setup_scheduler(app):
     
     return scheduler
 
-def send_eod_prompts(app):
+@skip_on_holiday
+def send_eod_prompts(app, slack_bot=None, firebase_client=None):
     """Send EOD prompts to users"""
-    with app.app_context():
-        try:
-            from app import slack_bot, firebase_client
-            
-            # Check if Firebase client is initialized
-            if not firebase_client:
-                logger.error("Firebase client not initialized. Cannot send EOD prompts.")
-                return
-            
-            # Skip weekends
-            now = datetime.now(ZoneInfo("America/New_York"))
-            if now.weekday() >= 5:  # Saturday = 5, Sunday = 6
-                logger.info("Skipping EOD prompts for weekend")
-                return
-            
-            # Define internal team user IDs to exclude
-            INTERNAL_TEAM_IDS = [
-                "U083K838X8V",  # Harlan
-                "U0890AG4ZEU",
-                "U0837HZE98X",
-                "U08CSFHTJ2X",
-                "USLACKBOT"     # Exclude Slackbot
-            ]
-            
-            # Get date range for today
-            today = now.date()
-            start = datetime.combine(today, datetime.min.time()).replace(tzinfo=ZoneInfo("America/New_York"))
-            end = datetime.combine(today, datetime.max.time()).replace(tzinfo=ZoneInfo("America/New_York"))
-            
-            # Convert to UTC for Firebase query
-            start_utc = start.astimezone(ZoneInfo("UTC"))
-            end_utc = end.astimezone(ZoneInfo("UTC"))
-            
-            # Get users who have submitted today
-            submitted_users = set()
-            try:
-                # Query for today's submissions
-                today_docs = firebase_client.db.collection('eod_reports').where('timestamp', '>=', start_utc).where('timestamp', '<=', end_utc).stream()
-                
-                # Process each document
-                for doc in today_docs:
-                    doc_data = doc.to_dict()
-                    user_id = doc_data.get('user_id')
-                    if user_id:
-                        submitted_users.add(user_id)
-                
-                logger.info(f"Found {len(submitted_users)} users who have already submitted today")
-            except Exception as e:
-                logger.error(f"Error getting submitted users: {str(e)}")
-            
-            # Get all users from Slack
-            all_users = []
-            try:
-                # Get all users from Slack
-                response = slack_bot.client.users_list()
-                all_users = response["members"]
-                logger.info(f"Retrieved {len(all_users)} users from Slack")
-            except Exception as e:
-                logger.error(f"Error getting users from Slack: {str(e)}")
-                return
-            
-            # Create EOD prompt message
-            message = ("🔔 *Daily EOD Reminder*\n"
-                      "Please submit your End-of-Day report using the `/eod` command.")
-            
-            # Send to all active users except internal team, bots, deactivated accounts, and those who already submitted
-            sent_count = 0
-            for user in all_users:
-                user_id = user.get("id")
-                
-                # Skip if user is in internal team
-                if user_id in INTERNAL_TEAM_IDS:
-                    logger.info(f"Skipping internal team member: {user_id}")
-                    continue
-                
-                # Skip if user is a bot
-                if user.get("is_bot", False):
-                    logger.info(f"Skipping bot user: {user_id}")
-                    continue
-                
-                # Skip if user is deactivated
-                if user.get("deleted", False):
-                    logger.info(f"Skipping deactivated user: {user_id}")
-                    continue
-                
-                # Skip if user has already submitted
-                if user_id in submitted_users:
-                    logger.info(f"Skipping user who already submitted: {user_id}")
-                    continue
-                
-                # Send message to user
-                slack_bot.send_message(user_id, message)
-                sent_count += 1
-                logger.info(f"Sent EOD prompt to user {user_id}")
-            
-            logger.info(f"Sent EOD prompts to {sent_count} users")
-                
-        except Exception as e:
-            logger.error(f"Error sending EOD prompts: {str(e)}")
-            logger.error(traceback.format_exc())
+    _notify_unsubmitted(app, EOD_PROMPT_MSG, "EOD prompts",
+                        slack_bot=slack_bot, firebase_client=firebase_client)
 
-def send_reminders(app):
+@skip_on_holiday
+def send_reminders(app, slack_bot=None, firebase_client=None):
     """Send reminders to users who haven't submitted reports"""
-    with app.app_context():
-        try:
-            from app import slack_bot, firebase_client
-            
-            # Check if Firebase client is initialized
-            if not firebase_client:
-                logger.error("Firebase client not initialized. Cannot send reminders.")
-                return
-            
-            # Skip weekends
-            now = datetime.now(ZoneInfo("America/New_York"))
-            if now.weekday() >= 5:  # Saturday = 5, Sunday = 6
-                logger.info("Skipping reminders for weekend")
-                return
-            
-            # Define internal team user IDs to exclude
-            INTERNAL_TEAM_IDS = [
-                "U083K838X8V",  # Harlan
-                "U0890AG4ZEU",
-                "U0837HZE98X",
-                "U08CSFHTJ2X",
-                "USLACKBOT"     # Exclude Slackbot
-            ]
-            
-            # Get date range for today
-            start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            end = now.replace(hour=23, minute=59, second=59, microsecond=999999)
-            
-            # Get all users from Slack
-            all_users = []
-            try:
-                # Get all users from Slack
-                response = slack_bot.client.users_list()
-                all_users = response["members"]
-                logger.info(f"Retrieved {len(all_users)} users from Slack")
-            except Exception as e:
-                logger.error(f"Error getting users from Slack: {str(e)}")
-                return
-            
-            # Get users who have submitted today
-            submitted_users = set()
-            try:
-                # Convert to UTC for Firebase query
-                start_utc = start.astimezone(ZoneInfo("UTC"))
-                end_utc = end.astimezone(ZoneInfo("UTC"))
-                
-                # Query for today's submissions
-                today_docs = firebase_client.db.collection('eod_reports').where('timestamp', '>=', start_utc).where('timestamp', '<=', end_utc).stream()
-                
-                # Process each document
-                for doc in today_docs:
-                    doc_data = doc.to_dict()
-                    user_id = doc_data.get('user_id')
-                    if user_id:
-                        submitted_users.add(user_id)
-                
-                logger.info(f"Found {len(submitted_users)} users who have submitted today")
-            except Exception as e:
-                logger.error(f"Error getting submitted users: {str(e)}")
-            
-            # Create reminder message
-            message = "⏰ *Reminder*: Please submit your EOD report for today using the `/eod` command."
-            
-            # Send to all active users who haven't submitted yet
-            sent_count = 0
-            for user in all_users:
-                user_id = user.get("id")
-                
-                # Skip if user is in internal team
-                if user_id in INTERNAL_TEAM_IDS:
-                    logger.info(f"Skipping internal team member: {user_id}")
-                    continue
-                
-                # Skip if user is a bot
-                if user.get("is_bot", False):
-                    logger.info(f"Skipping bot user: {user_id}")
-                    continue
-                
-                # Skip if user is deactivated
-                if user.get("deleted", False):
-                    logger.info(f"Skipping deactivated user: {user_id}")
-                    continue
-                
-                # Skip if user has already submitted
-                if user_id in submitted_users:
-                    logger.info(f"Skipping user who already submitted: {user_id}")
-                    continue
-                
-                # Send message to user
-                slack_bot.send_message(user_id, message)
-                sent_count += 1
-                logger.info(f"Sent reminder to user {user_id}")
-            
-            logger.info(f"Sent reminders to {sent_count} users")
-                
-        except Exception as e:
-            logger.error(f"Error sending reminders: {str(e)}")
-            logger.error(traceback.format_exc())
+    _notify_unsubmitted(app, REMINDER_MSG, "reminders",
+                        slack_bot=slack_bot, firebase_client=firebase_client)
 
-def send_final_reminders(app):
+@skip_on_holiday
+def send_final_reminders(app, slack_bot=None, firebase_client=None):
     """Send final reminders to users who haven't submitted reports"""
-    with app.app_context():
-        try:
-            from app import slack_bot, firebase_client
-            
-            # Check if Firebase client is initialized
-            if not firebase_client:
-                logger.error("Firebase client not initialized. Cannot send final reminders.")
-                return
-            
-            # Skip weekends
-            now = datetime.now(ZoneInfo("America/New_York"))
-            if now.weekday() >= 5:  # Saturday = 5, Sunday = 6
-                logger.info("Skipping final reminders for weekend")
-                return
-            
-            # Define internal team user IDs to exclude
-            INTERNAL_TEAM_IDS = [
-                "U083K838X8V",  # Harlan
-                "U0890AG4ZEU",
-                "U0837HZE98X",
-                "U08CSFHTJ2X",
-                "USLACKBOT"     # Exclude Slackbot
-            ]
-            
-            # Get date range for today
-            start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            end = now.replace(hour=23, minute=59, second=59, microsecond=999999)
-            
-            # Get all users from Slack
-            all_users = []
-            try:
-                # Get all users from Slack
-                response = slack_bot.client.users_list()
-                all_users = response["members"]
-                logger.info(f"Retrieved {len(all_users)} users from Slack")
-            except Exception as e:
-                logger.error(f"Error getting users from Slack: {str(e)}")
-                return
-            
-            # Get users who have submitted today
-            submitted_users = set()
-            try:
-                # Convert to UTC for Firebase query
-                start_utc = start.astimezone(ZoneInfo("UTC"))
-                end_utc = end.astimezone(ZoneInfo("UTC"))
-                
-                # Query for today's submissions
-                today_docs = firebase_client.db.collection('eod_reports').where('timestamp', '>=', start_utc).where('timestamp', '<=', end_utc).stream()
-                
-                # Process each document
-                for doc in today_docs:
-                    doc_data = doc.to_dict()
-                    user_id = doc_data.get('user_id')
-                    if user_id:
-                        submitted_users.add(user_id)
-                
-                logger.info(f"Found {len(submitted_users)} users who have submitted today")
-            except Exception as e:
-                logger.error(f"Error getting submitted users: {str(e)}")
-            
-            # Create final reminder message
-            message = ("🚨 *Last Call*\nYou haven't submitted your EOD report for today. "
-                      "Please submit it in the next 30 minutes before the daily report is sent to management.")
-            
-            # Send to all active users who haven't submitted yet
-            sent_count = 0
-            for user in all_users:
-                user_id = user.get("id")
-                
-                # Skip if user is in internal team
-                if user_id in INTERNAL_TEAM_IDS:
-                    logger.info(f"Skipping internal team member: {user_id}")
-                    continue
-                
-                # Skip if user is a bot
-                if user.get("is_bot", False):
-                    logger.info(f"Skipping bot user: {user_id}")
-                    continue
-                
-                # Skip if user is deactivated
-                if user.get("deleted", False):
-                    logger.info(f"Skipping deactivated user: {user_id}")
-                    continue
-                
-                # Skip if user has already submitted
-                if user_id in submitted_users:
-                    logger.info(f"Skipping user who already submitted: {user_id}")
-                    continue
-                
-                # Send message to user
-                slack_bot.send_message(user_id, message)
-                sent_count += 1
-                logger.info(f"Sent final reminder to user {user_id}")
-            
-            logger.info(f"Sent final reminders to {sent_count} users")
-                
-        except Exception as e:
-            logger.error(f"Error sending final reminders: {str(e)}")
-            logger.error(traceback.format_exc())
+    _notify_unsubmitted(app, LAST_CALL_MSG, "final reminders",
+                        slack_bot=slack_bot, firebase_client=firebase_client)
 
-def send_daily_non_submission_report(app):
+@skip_on_holiday
+def send_daily_non_submission_report(app, slack_bot=None, firebase_client=None):
     """Send daily report of non-submissions to management"""
     with app.app_context():
         try:
-            from app import slack_bot, firebase_client
-            
+            if slack_bot is None or firebase_client is None:
+                from app import slack_bot, firebase_client
+
             # Check if Firebase client is initialized
             if not firebase_client:
                 logger.error("Firebase client not initialized. Cannot send non-submission report.")
                 return
             
-            # Skip weekends
-            now = datetime.now(ZoneInfo("America/New_York"))
-            if now.weekday() >= 5:  # Saturday = 5, Sunday = 6
-                logger.info("Skipping non-submission report for weekend")
-                return
-            
-            # Get today's date
+            # Get today's date (weekends are excluded by the cron trigger)
+            now = datetime.now(_NY)
             today = now.date()
             logger.info(f"Generating non-submission report for date: {today}")
             
-            # Define internal team user IDs to exclude
-            INTERNAL_TEAM_IDS = [
-                "U083K838X8V",  # Harlan
-                "U0890AG4ZEU",
-                "U0837HZE98X",
-                "U08CSFHTJ2X",
-                "USLACKBOT"     # Exclude Slackbot
-            ]
-            logger.info(f"Will exclude internal team members and Slackbot: {INTERNAL_TEAM_IDS}")
-            
+            logger.info(f"Will exclude internal team members and Slackbot: {sorted(INTERNAL_TEAM_IDS)}")
+
+            # Get all users who have ever submitted an EOD report, via a
+            # projected query instead of streaming every full report document
+            all_users = firebase_client.get_distinct_submitters() - INTERNAL_TEAM_IDS
 
-            
-            # Get all users who have ever submitted an EOD report
-            all_users = set()
-            all_docs = list(firebase_client.db.collection('eod_reports').stream())
-            logger.info(f"Found {len(all_docs)} total EOD reports in the database")
-            
-            for doc in all_docs:
-                doc_data = doc.to_dict()
-                user_id = doc_data.get('user_id')
-                if user_id and user_id not in INTERNAL_TEAM_IDS:  # Exclude internal team and Slackbot
-                    all_users.add(user_id)
-            
             logger.info(f"Found {len(all_users)} unique users who have submitted EOD reports (excluding internal team and Slackbot)")
             
-            # Get user names from Slack and filter out bots and deactivated accounts
-            user_names = {}
-            valid_users = set()
-            
-            for user_id in all_users:
-                try:
-                    # Skip Slackbot explicitly
-                    if user_id == "USLACKBOT":
-                        logger.info(f"Skipping Slackbot user: {user_id}")
-                        continue
-                    
+            # Get the workspace directory once and resolve names from it; the
+            # users.list snapshot already carries real_name/is_bot/deleted, so
+            # no per-user users_info round-trips are needed. IDs missing from
+            # the snapshot belong to departed users and are skipped.
+            workspace_by_id = {}
+            try:
+                _, workspace_by_id = _get_workspace_users(slack_bot)
+            except Exception as e:
+                logger.error(f"Error getting workspace users from Slack: {str(e)}")
+
+            # The snapshot already carries is_bot/deleted, and all_users has
+            # had the internal team (including Slackbot) subtracted, so one
+            # filtering pass over plain dicts is all that's left. Users
+            # missing from the snapshot are departed accounts.
+            valid_users = {
+                user_id for user_id in all_users
+                if (user := workspace_by_id.get(user_id)) is not None
+                and not user.get('is_bot', False)
+                and not user.get('deleted', False)
+            }
+            user_names = {
+                user_id: workspace_by_id[user_id].get('real_name') or f"Unknown ({user_id})"
+                for user_id in valid_users
+            }
 
-                        
-                    user_info = slack_bot.client.users_info(user=user_id)
-                    
-                    # Skip if user is a bot
-                    if user_info.get('user', {}).get('is_bot', False):
-                        logger.info(f"Skipping bot user: {user_id}")
-                        continue
-                    
-                    # Skip if user is deactivated
-                    if user_info.get('user', {}).get('deleted', False):
-                        logger.info(f"Skipping deactivated user: {user_id}")
-                        continue
-                    
-                    # Skip if user is in internal team
-                    if user_id in INTERNAL_TEAM_IDS:
-                        logger.info(f"Skipping internal team member: {user_id}")
-                        continue
-                    
-                    user_name = user_info['user']['real_name'] if user_info else f"Unknown ({user_id})"
-                    user_names[user_id] = user_name
-                    valid_users.add(user_id)
-                    logger.info(f"Valid user: {user_name} (ID: {user_id})")
-                except Exception as e:
-                    logger.error(f"Error getting user info: {str(e)}")
-                    # Skip users we can't get info for - they might be invalid
-            
             logger.info(f"Found {len(valid_users)} valid human users (non-bot, non-deactivated, non-internal, non-Slackbot)")
             
-            # Define today's date range in UTC (since Firebase stores in UTC)
-            today_start_ny = datetime.combine(today, datetime.min.time()).replace(tzinfo=ZoneInfo("America/New_York"))
-            today_end_ny = datetime.combine(today, datetime.max.time()).replace(tzinfo=ZoneInfo("America/New_York"))
-            
-            # Convert to UTC for Firebase query
-            today_start_utc = today_start_ny.astimezone(ZoneInfo("UTC"))
-            today_end_utc = today_end_ny.astimezone(ZoneInfo("UTC"))
-            
-            logger.info(f"Filtering for submissions between {today_start_utc} and {today_end_utc} (UTC)")
-            
-            # Initialize empty set for submitted users
-            submitted_today = set()
-            
-            # Query specifically for today's submissions in UTC
-            today_docs = firebase_client.db.collection('eod_reports').where('timestamp', '>=', today_start_utc).where('timestamp', '<=', today_end_utc).stream()
-            
-            # Process each document from today's query
-            for doc in today_docs:
-                doc_data = doc.to_dict()
-                doc_id = doc.id
-                user_id = doc_data.get('user_id', 'No user ID')
-                timestamp = doc_data.get('timestamp')
-                
-                if not timestamp:
-                    logger.warning(f"Document {doc_id} has no timestamp, skipping")
-                    continue
-                
-                user_name = user_names.get(user_id, f"Unknown ({user_id})")
-                logger.info(f"Today's submission: {user_name} (ID: {user_id}) at {timestamp}")
-                submitted_today.add(user_id)
-            
+            # Reuse the shared today-submitters cache; the reminder jobs that
+            # ran earlier in the evening usually populated it already, so this
+            # is typically no extra Firestore query at all
+            submitted_today = _get_submitted_today(firebase_client, now)
             logger.info(f"Found {len(submitted_today)} users who submitted today")
             
-            # Calculate missing users
-            missing_users = [user_id for user_id in valid_users if user_id not in submitted_today]
+            # Calculate missing users via set difference - both sides are sets
+            missing_users = list(valid_users - submitted_today)
             logger.info(f"Missing users count: {len(missing_users)} out of {len(valid_users)} total valid users")
             
             # Get past submissions to calculate consecutive missed days
@@ -526,85 +458,88 @@ def send_daily_non_submission_report(app):
             
             # Get submissions from the past 30 days
             thirty_days_ago = today - timedelta(days=30)
-            thirty_days_ago_start = datetime.combine(thirty_days_ago, datetime.min.time()).replace(tzinfo=ZoneInfo("America/New_York"))
-            thirty_days_ago_start_utc = thirty_days_ago_start.astimezone(ZoneInfo("UTC"))
-            
-            past_docs = firebase_client.db.collection('eod_reports').where('timestamp', '>=', thirty_days_ago_start_utc).stream()
-            
+            thirty_days_ago_start = datetime.combine(thirty_days_ago, datetime.min.time()).replace(tzinfo=_NY)
+            thirty_days_ago_start_utc = thirty_days_ago_start.astimezone(_UTC)
+            
+            # Projected query - only user_id and timestamp come back per doc
+            past_docs = firebase_client.db.collection('eod_reports')\
+                .select(['user_id', 'timestamp'])\
+                .where(filter=firestore.FieldFilter('timestamp', '>=', thirty_days_ago_start_utc))\
+                .stream()
+
             for doc in past_docs:
                 doc_data = doc.to_dict()
                 user_id = doc_data.get('user_id')
                 timestamp = doc_data.get('timestamp')
-                
+
                 if not user_id or not timestamp:
                     continue
-                
+
                 # Skip internal team
                 if user_id in INTERNAL_TEAM_IDS:
                     continue
-                
+
                 # Convert timestamp to NY date
-                submission_date = timestamp.astimezone(ZoneInfo("America/New_York")).date()
-                
+                submission_date = timestamp.astimezone(_NY).date()
+
                 if user_id not in past_submissions:
                     past_submissions[user_id] = set()
-                
+
                 past_submissions[user_id].add(submission_date)
-            
+
+            # Freeze the per-user date sets now that the stream is complete
+            past_submissions = {
+                uid: frozenset(dates) for uid, dates in past_submissions.items()
+            }
+
+            # Precompute the working days in the lookback window once (newest
+            # first) instead of re-walking weekends/holidays for every user
+            working_days_desc = [
+                d for d in (today - timedelta(days=i) for i in range(1, 31))
+                if d.weekday() < 5 and d not in HOLIDAY_DATES
+            ]
+
             # Now calculate consecutive missed days for each missing user
             consecutive_missed_days = {}
             for user_id in missing_users:
-                # Start from yesterday and go backwards
-                check_date = today - timedelta(days=1)
+                user_submissions = past_submissions.get(user_id, frozenset())
                 consecutive_days = 1  # Today is already missed
-                
-                while True:
-                    # Skip weekends and holidays
-                    if check_date.weekday() >= 5 or check_date in HOLIDAYS:
-                        check_date = check_date - timedelta(days=1)
-                        continue
-                    
-                    # Check if user submitted on this date
-                    user_submissions = past_submissions.get(user_id, set())
+
+                for check_date in working_days_desc:
                     if check_date in user_submissions:
                         # Found a submission, stop counting
                         break
-                    else:
-                        # No submission found, increment counter
-                        consecutive_days += 1
-                        check_date = check_date - timedelta(days=1)
-                        
-                        # Limit how far back we check
-                        if consecutive_days >= 30 or check_date < thirty_days_ago:
-                            break
-                
+                    consecutive_days += 1
+
                 consecutive_missed_days[user_id] = consecutive_days
             
             # Sort missing users by name for the report
             missing_users_with_names = [(user_id, user_names.get(user_id, "Unknown")) for user_id in missing_users]
-            missing_users_with_names.sort(key=lambda x: x[1])  # Sort by name
-            
-            # Create management message
-            mgmt_message = (
-                "📊 *Daily EOD Submission Report*\n"
-                f"📅 *Date:* {today.strftime('%A, %B %d, %Y')}\n\n"
-            )
-            
+            missing_users_with_names.sort(key=itemgetter(1))  # Sort by name
+
+            # Build the management message as a list of parts; repeated
+            # string += is quadratic in the total message size
+            parts = [
+                "📊 *Daily EOD Submission Report*\n",
+                f"📅 *Date:* {today:%A, %B %d, %Y}\n\n"
+            ]
+
             if missing_users:
-                mgmt_message += "⚠️ *Missing Submissions:*\n"
-                
+                parts.append("⚠️ *Missing Submissions:*\n")
+
                 # Add missing users to report (alphabetically by name)
                 for user_id, user_name in missing_users_with_names:
                     consecutive_days = consecutive_missed_days.get(user_id, 1)
                     streak_text = "day" if consecutive_days == 1 else "days"
-                    mgmt_message += f"• *{user_name}* (<@{user_id}>)\n"
-                    mgmt_message += f"   ↳ _Missed {consecutive_days} consecutive working {streak_text}_\n"
-                    logger.info(f"Adding to report: {user_name} (ID: {user_id}) - {consecutive_days} consecutive missed days")
-                
+                    parts.append(f"• *{user_name}* (<@{user_id}>)\n")
+                    parts.append(f"   ↳ _Missed {consecutive_days} consecutive working {streak_text}_\n")
+
                 # Add summary count
-                mgmt_message += f"\n_Total: {len(missing_users)} missing out of {len(valid_users)} expected submissions_"
+                parts.append(f"\n_Total: {len(missing_users)} missing out of {len(valid_users)} expected submissions_")
             else:
-                mgmt_message += "✅ *All team members have submitted their EOD reports today!*"
+                parts.append("✅ *All team members have submitted their EOD reports today!*")
+
+            mgmt_message = "".join(parts)
             
             # Log the final message
             logger.info(f"Final management message:\n{mgmt_message}")
@@ -617,14 +552,15 @@ def send_daily_non_submission_report(app):
             logger.error(f"Error sending non-submission report: {str(e)}")
             logger.error(traceback.format_exc())
 
-def generate_weekly_summary(app):
+def generate_weekly_summary(app, slack_bot=None):
     """Generate and send weekly summary report"""
     with app.app_context():
         try:
-            from app import slack_bot
-            
+            if slack_bot is None:
+                from app import slack_bot
+
             # Only run on Fridays
-            now = datetime.now(ZoneInfo("America/New_York"))
+            now = datetime.now(_NY)
             if now.weekday() != 4:  # Friday = 4
                 logger.info("Skipping weekly summary - not Friday")
                 return
@@ -667,7 +603,7 @@ def update_tracker_with_test_data(app):
                 from app import slack_bot, firebase_client
                 
                 # Get today's actual submissions
-                today = datetime.now(ZoneInfo("America/New_York")).date()
+                today = datetime.now(_NY).date()
                 logger.info(f"TODAY'S DATE: {today} (America/New_York timezone)")
                 
                 # CRITICAL: Get all active users first
@@ -681,7 +617,8 @@ def update_tracker_with_test_data(app):
                         user_info = slack_bot.client.users_info(user=user_id)
                         user_name = user_info['user']['real_name'] if user_info else f"Unknown ({user_id})"
                         user_names[user_id] = user_name
-                        logger.info(f"USER: {user_name} (ID: {user_id})")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"USER: {user_name} (ID: {user_id})")
                     except Exception as e:
                         logger.error(f"Error getting user info: {str(e)}")
                         user_names[user_id] = f"Unknown ({user_id})"
@@ -690,12 +627,7 @@ def update_tracker_with_test_data(app):
                 logger.info("=== GETTING TODAY'S SUBMISSIONS WITH EXPLICIT DATE FILTERING ===")
                 
                 # Define today's date range in UTC (since Firebase stores in UTC)
-                today_start_ny = datetime.combine(today, datetime.min.time()).replace(tzinfo=ZoneInfo("America/New_York"))
-                today_end_ny = datetime.combine(today, datetime.max.time()).replace(tzinfo=ZoneInfo("America/New_York"))
-                
-                # Convert to UTC for Firebase query
-                today_start_utc = today_start_ny.astimezone(ZoneInfo("UTC"))
-                today_end_utc = today_end_ny.astimezone(ZoneInfo("UTC"))
+                today_start_utc, today_end_utc = today_utc_window(today)
                 
                 logger.info(f"FILTERING FOR SUBMISSIONS BETWEEN {today_start_utc} AND {today_end_utc} (UTC)")
                 
@@ -703,38 +635,35 @@ def update_tracker_with_test_data(app):
                 submitted_today = set()
                 
                 # CRITICAL: Query specifically for today's submissions in UTC
-                today_docs = firebase_client.db.collection('eod_reports').where('timestamp', '>=', today_start_utc).where('timestamp', '<=', today_end_utc).stream()
+                today_docs = firebase_client.db.collection('eod_reports')\
+                    .select(['user_id', 'timestamp'])\
+                    .where(filter=firestore.FieldFilter('timestamp', '>=', today_start_utc))\
+                    .where(filter=firestore.FieldFilter('timestamp', '<=', today_end_utc))\
+                    .stream()
                 
                 # Process each document from today's query
-                logger.info("=== PROCESSING TODAY'S SUBMISSIONS ===")
                 for doc in today_docs:
                     doc_data = doc.to_dict()
                     doc_id = doc.id
                     user_id = doc_data.get('user_id', 'No user ID')
                     timestamp = doc_data.get('timestamp')
-                    
+
                     if not timestamp:
                         logger.warning(f"DOCUMENT {doc_id} HAS NO TIMESTAMP, SKIPPING")
                         continue
-                    
-                    user_name = user_names.get(user_id, f"Unknown ({user_id})")
-                    logger.info(f"TODAY'S SUBMISSION: {user_name} (ID: {user_id}) at {timestamp}")
+
+                    if logger.isEnabledFor(logging.DEBUG):
+                        user_name = user_names.get(user_id, f"Unknown ({user_id})")
+                        logger.debug(f"TODAY'S SUBMISSION: {user_name} (ID: {user_id}) at {timestamp}")
                     submitted_today.add(user_id)
-                
+
                 logger.info(f"FOUND {len(submitted_today)} USERS WHO SUBMITTED TODAY")
-                
-                # CRITICAL: Explicitly log who submitted and who didn't
-                logger.info("=== SUBMISSION STATUS FOR ALL USERS ===")
-                for user_id, user_name in user_names.items():
-                    if user_id in submitted_today:
-                        logger.info(f"✅ SUBMITTED: {user_name} (ID: {user_id})")
-                    else:
-                        logger.info(f"❌ NOT SUBMITTED: {user_name} (ID: {user_id})")
-                logger.info("=== END SUBMISSION STATUS ===")
-                
-                # Calculate missing users
+
+                # Calculate missing users; one aggregated log line instead of
+                # a per-user status dump
                 missing_users = [user_id for user_id in all_users if user_id not in submitted_today]
-                logger.info(f"MISSING USERS COUNT: {len(missing_users)} OUT OF {len(all_users)} TOTAL USERS")
+                logger.info("MISSING USERS (%d of %d): %s",
+                            len(missing_users), len(all_users), missing_users)
                 
                 # Create management message
                 mgmt_message = (f"*Daily EOD Submission Report*\n"
@@ -746,7 +675,6 @@ def update_tracker_with_test_data(app):
                     for user_id in missing_users:
                         user_name = user_names.get(user_id, "Unknown")
                         mgmt_message += f"• {user_name} (<@{user_id}>)\n"
-                        logger.info(f"ADDING TO REPORT: {user_name} (ID: {user_id})")
                 else:
                     mgmt_message += "✅ All team members have submitted their EOD reports today!"
                 
@@ -757,11 +685,12 @@ def update_tracker_with_test_data(app):
                 slack_bot.send_message(TARGET_USER_ID, mgmt_message)
                 logger.info(f"SENT MANAGEMENT REPORT TO USER {TARGET_USER_ID}")
                 
-                # Also send to management users if defined
+                # Also send to management users if defined, through the same
+                # paced batch sender the reminder jobs use
                 MANAGEMENT_USERS = [TARGET_USER_ID]  # Define management users
-                for mgmt_user_id in MANAGEMENT_USERS:
-                    if mgmt_user_id != TARGET_USER_ID:  # Avoid duplicate to test user
-                        slack_bot.send_message(mgmt_user_id, mgmt_message)
+                extra_recipients = [uid for uid in MANAGEMENT_USERS
+                                    if uid != TARGET_USER_ID]  # Avoid duplicate to test user
+                _send_message_batch(slack_bot, extra_recipients, mgmt_message)
                 
             except Exception as e:
                 logger.error(f"ERROR SENDING TEST NOTIFICATIONS: {str(e)}")
@@ -2,7 +2,13 @@ from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from config import Config
 from firebase_client import FirebaseClient
+from slack_client import SlackClient
+import functools
 import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, date
 import json
 from zoneinfo import ZoneInfo
@@ -10,6 +16,20 @@ import traceback
 
 logger = logging.getLogger(__name__)
 
+# Shared timezone object so each sheet update stops re-resolving the tz
+# database string
+_NY = ZoneInfo("America/New_York")
+
+# Internal team members excluded from the tracker sheet (same set the
+# scheduler uses for its reports)
+INTERNAL_TEAM_IDS = frozenset({
+    "U083K838X8V",  # Harlan
+    "U0890AG4ZEU",
+    "U0837HZE98X",
+    "U08CSFHTJ2X",
+    "USLACKBOT"     # Exclude Slackbot
+})
+
 HOLIDAYS = {
     date(2024, 1, 1): "New Year's Day",
     date(2024, 4, 17): "Maundy Thursday",
@@ -21,6 +41,50 @@ HOLIDAYS = {
     date(2024, 12, 30): "Rizal Day"
 }
 
+# Frozen key view of HOLIDAYS for the hot membership test
+HOLIDAY_DATES = frozenset(HOLIDAYS)
+
+# Batched-write thresholds: queued range updates go out once this many are
+# pending or this many seconds after the last flush, whichever comes first
+_FLUSH_MAX_QUEUED = 10
+_FLUSH_INTERVAL = 2.0
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_holiday(check_date):
+    """Check if a date is a holiday"""
+    return check_date in HOLIDAY_DATES
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_weekend(check_date):
+    """Check if a date is a weekend"""
+    return check_date.weekday() >= 5  # Saturday = 5, Sunday = 6
+
+
+# Accumulated tracker state shared across SheetsClient instances, so the
+# nightly update only streams reports newer than the Firestore cursor instead
+# of re-reading the whole collection every run. A process restart clears it
+# and the next run falls back to a full rebuild.
+_tracker_state = {
+    "users": set(),          # contractor names seen
+    "submissions": {},       # date -> set of names who submitted
+    "dates": set(),          # dates with at least one submission
+    "cursor": None           # max timestamp applied so far
+}
+
+# Process-wide Sheets service and parsed credentials. The service account
+# JSON and the discovery client are immutable per deployment, so repeated
+# SheetsClient constructions reuse one instance instead of re-parsing and
+# re-building each time.
+_sheets_service = None
+_sheets_credentials = None
+
+# Set once the submissions-sheet headers have been verified this process.
+# SheetsClient is constructed per scheduled run, and re-checking headers is
+# an unconditional API round-trip that only matters the very first time.
+_headers_verified = False
+
 
 class SheetsClient:
 
@@ -33,28 +97,156 @@ class SheetsClient:
         if Config.firebase_config_valid():
             self.firebase_client = FirebaseClient()
 
+        # Memoized Slack user info keyed by user ID, so N submissions from K
+        # users cost K lookups instead of N
+        self._user_cache = {}
+
+        # Memoized user_id -> (name, skip) for the tracker rebuild, where
+        # `skip` records the bot/deactivated decision so it is also cached
+        self._user_name_cache = {}
+
+        # Shared SlackClient, created on first use so its HTTP session and
+        # connection pool are reused across methods
+        self._slack = None
+
+        # Cached (date, name) -> row index for the submissions sheet, so each
+        # submission does an O(1) lookup instead of refetching and scanning
+        # the whole column. Today's rows are appended by this process and
+        # written through to the index, so one fetch per calendar day is
+        # enough; the index is invalidated at the New York midnight rollover
+        self._row_index = {}
+        self._row_index_day = None
+
+        # Cached sheet-title -> sheetId mapping; tab IDs never change, so one
+        # metadata fetch covers the client's lifetime
+        self._sheet_ids = {}
+
+        # Queued range updates, flushed together through one
+        # values.batchUpdate so bursts of submissions share round-trips
+        # instead of each paying their own against the write quota
+        self._pending_updates = []
+        self._flush_lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._flush_timer = None
+
         # Initialize headers if needed
         self._init_headers()
 
     def _get_sheets_service(self):
-        """Initialize Google Sheets API service"""
+        """Initialize Google Sheets API service, shared across instances"""
+        global _sheets_service, _sheets_credentials
+        if _sheets_service is not None:
+            return _sheets_service
+
         SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
 
         try:
-            # Load service account info from environment
-            service_account_info = json.loads(Config.GOOGLE_SERVICE_ACCOUNT)
-
-            credentials = service_account.Credentials.from_service_account_info(
-                service_account_info, scopes=SCOPES)
-
-            return build('sheets', 'v4', credentials=credentials)
+            if _sheets_credentials is None:
+                # Parse the service account JSON from the environment once
+                service_account_info = json.loads(
+                    Config.GOOGLE_SERVICE_ACCOUNT)
+                _sheets_credentials = \
+                    service_account.Credentials.from_service_account_info(
+                        service_account_info, scopes=SCOPES)
+
+            # static_discovery uses the bundled discovery doc instead of
+            # fetching (or disk-caching) it at build time
+            _sheets_service = build('sheets',
+                                    'v4',
+                                    credentials=_sheets_credentials,
+                                    cache_discovery=False,
+                                    static_discovery=True)
+            return _sheets_service
 
         except Exception as e:
             logger.error(f"Error initializing sheets service: {str(e)}")
             return None
 
+    def _get_slack_client(self):
+        """Get the shared SlackClient, created on first use"""
+        if self._slack is None:
+            self._slack = SlackClient(Config.SLACK_BOT_OAUTH_TOKEN)
+        return self._slack
+
+    def _fetch_workspace_users(self, slack_client):
+        """Fetch the full workspace member list once, keyed by user ID"""
+        members = {}
+        try:
+            cursor = None
+            while True:
+                response = slack_client.client.users_list(limit=200,
+                                                          cursor=cursor)
+                for member in response.get('members', []):
+                    members[member['id']] = member
+                cursor = response.get('response_metadata',
+                                      {}).get('next_cursor')
+                if not cursor:
+                    break
+        except Exception as e:
+            logger.error(f"Error fetching workspace users: {str(e)}")
+        return members
+
+    def _get_cached_user_info(self, user_id):
+        """Get Slack user info for a user, memoized for this client's lifetime"""
+        if user_id in self._user_cache:
+            return self._user_cache[user_id]
+        user_info = self._get_slack_client().get_user_info(user_id)
+        self._user_cache[user_id] = user_info
+        return user_info
+
+    def _resolve_user(self, user_id):
+        """Resolve a user ID to (name, email) via the memoized Slack lookup"""
+        try:
+            user_info = self._get_cached_user_info(user_id)
+            user_name = user_info.get(
+                'real_name', 'Unknown') if user_info else 'Unknown'
+            user_email = user_info.get('profile', {}).get(
+                'email', 'Unknown') if user_info else 'Unknown'
+            return user_name, user_email
+        except Exception as e:
+            logger.error(f"Error getting Slack user info: {str(e)}")
+            return 'Unknown', 'Unknown'
+
+    def _get_sheet_id(self, title):
+        """Get the numeric sheetId for a tab title, memoized on the instance"""
+        if title in self._sheet_ids:
+            return self._sheet_ids[title]
+
+        # Request only the properties we need instead of the full metadata
+        sheet_metadata = self.service.spreadsheets().get(
+            spreadsheetId=self.sheet_id,
+            fields='sheets.properties(sheetId,title)').execute()
+        for sheet in sheet_metadata.get('sheets', []):
+            props = sheet.get('properties', {})
+            if 'title' in props and 'sheetId' in props:
+                self._sheet_ids[props['title']] = props['sheetId']
+
+        return self._sheet_ids.get(title)
+
+    def _get_row_index(self):
+        """Map (date_str, user_name) -> 1-based sheet row, fetched once per day"""
+        today = datetime.now(_NY).date()
+        if self._row_index and self._row_index_day == today:
+            return self._row_index
+
+        result = self.service.spreadsheets().values().get(
+            spreadsheetId=self.sheet_id,
+            range=f"{Config.SUBMISSIONS_SHEET}!A:D").execute()
+        existing_rows = result.get('values', [])
+
+        self._row_index = {
+            (row[1], row[2]): i + 1
+            for i, row in enumerate(existing_rows) if len(row) >= 4
+        }
+        self._row_index_day = today
+        return self._row_index
+
     def _init_headers(self):
         """Initialize sheet headers if they don't exist"""
+        global _headers_verified
+        if _headers_verified:
+            return
+
         try:
             # Check if headers exist
             result = self.service.spreadsheets().values().get(
@@ -73,60 +265,57 @@ class SheetsClient:
                 # Update headers and format
                 self._update_sheet_formatting(headers)
 
+            _headers_verified = True
+
         except Exception as e:
             logger.error(f"Error initializing headers: {str(e)}")
 
     def _update_sheet_formatting(self, headers):
-        """Update sheet formatting with headers"""
+        """Write headers and apply sheet formatting in one batchUpdate"""
         try:
-            # Update headers
-            self.service.spreadsheets().values().update(
-                spreadsheetId=self.sheet_id,
-                range=f"{Config.SUBMISSIONS_SHEET}!A1",
-                valueInputOption='RAW',
-                body={
-                    'values': [headers]
-                }).execute()
+            # Get sheet ID for submissions sheet (cached after the first
+            # metadata fetch)
+            sheet_id = self._get_sheet_id(Config.SUBMISSIONS_SHEET)
 
-            # Get sheet ID for submissions sheet
-            sheet_metadata = self.service.spreadsheets().get(
-                spreadsheetId=self.sheet_id).execute()
-            sheet_id = None
-            for sheet in sheet_metadata.get('sheets', ''):
-                if sheet['properties']['title'] == Config.SUBMISSIONS_SHEET:
-                    sheet_id = sheet['properties']['sheetId']
-                    break
-
-            if not sheet_id:
+            if sheet_id is None:
                 logger.error("Could not find submissions sheet ID")
                 return
 
-            # Format requests
+            header_format = {
+                'backgroundColor': {
+                    'red': 0.95,
+                    'green': 0.95,
+                    'blue': 0.95
+                },
+                'textFormat': {
+                    'bold': True
+                },
+                'horizontalAlignment': 'CENTER',
+                'verticalAlignment': 'MIDDLE'
+            }
+
+            # One batchUpdate carries the header values, their formatting,
+            # the column widths, and the frozen row — instead of a separate
+            # values.update followed by a formatting call
             requests = [
-                # Header formatting
+                # Header values + formatting
                 {
-                    'repeatCell': {
-                        'range': {
+                    'updateCells': {
+                        'start': {
                             'sheetId': sheet_id,
-                            'startRowIndex': 0,
-                            'endRowIndex': 1
+                            'rowIndex': 0,
+                            'columnIndex': 0
                         },
-                        'cell': {
-                            'userEnteredFormat': {
-                                'backgroundColor': {
-                                    'red': 0.95,
-                                    'green': 0.95,
-                                    'blue': 0.95
+                        'rows': [{
+                            'values': [{
+                                'userEnteredValue': {
+                                    'stringValue': header
                                 },
-                                'textFormat': {
-                                    'bold': True
-                                },
-                                'horizontalAlignment': 'CENTER',
-                                'verticalAlignment': 'MIDDLE'
-                            }
-                        },
+                                'userEnteredFormat': header_format
+                            } for header in headers]
+                        }],
                         'fields':
-                        'userEnteredFormat(backgroundColor,textFormat,horizontalAlignment,verticalAlignment)'
+                        'userEnteredValue,userEnteredFormat(backgroundColor,textFormat,horizontalAlignment,verticalAlignment)'
                     }
                 },
                 # Column widths
@@ -158,7 +347,6 @@ class SheetsClient:
                 }
             ]
 
-            # Apply formatting
             self.service.spreadsheets().batchUpdate(
                 spreadsheetId=self.sheet_id, body={
                     'requests': requests
@@ -177,21 +365,10 @@ class SheetsClient:
             user_id = report_data.get('user_id')
 
             # Get user info from Slack
-            try:
-                from slack_client import SlackClient
-                slack_client = SlackClient(Config.SLACK_BOT_OAUTH_TOKEN)
-                user_info = slack_client.get_user_info(user_id)
-                user_name = user_info.get(
-                    'real_name', 'Unknown') if user_info else 'Unknown'
-                user_email = user_info.get('profile', {}).get(
-                    'email', 'Unknown') if user_info else 'Unknown'
-            except Exception as e:
-                logger.error(f"Error getting Slack user info: {str(e)}")
-                user_name = 'Unknown'
-                user_email = 'Unknown'
+            user_name, user_email = self._resolve_user(user_id)
 
             # Format timestamp and date
-            now = datetime.now(ZoneInfo("America/New_York"))
+            now = datetime.now(_NY)
             date_str = now.strftime('%Y-%m-%d')
             timestamp_str = now.strftime('%Y-%m-%d %H:%M:%S')
 
@@ -210,32 +387,17 @@ class SheetsClient:
                 report_data.get('client_feedback', '')
             ]
 
-            # Find existing row for today if it exists
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.sheet_id,
-                range=f"{Config.SUBMISSIONS_SHEET}!A:D").execute()
-
-            existing_rows = result.get('values', [])
-            row_to_update = None
-
-            for i, existing_row in enumerate(existing_rows):
-                if (len(existing_row) >= 4 and existing_row[2] == user_name
-                        and existing_row[1] == date_str):
-                    row_to_update = i + 1
-                    break
+            # Find existing row for today via the cached index
+            row_to_update = self._get_row_index().get((date_str, user_name))
 
             if row_to_update:
-                # Update existing row
-                self.service.spreadsheets().values().update(
-                    spreadsheetId=self.sheet_id,
-                    range=f"{Config.SUBMISSIONS_SHEET}!A{row_to_update}",
-                    valueInputOption='RAW',
-                    body={
-                        'values': [row]
-                    }).execute()
+                # Queue the in-place update; writes queued by concurrent
+                # submissions within the flush window share one batchUpdate
+                self._queue_write(
+                    f"{Config.SUBMISSIONS_SHEET}!A{row_to_update}", [row])
             else:
                 # Append new row
-                self.service.spreadsheets().values().append(
+                append_result = self.service.spreadsheets().values().append(
                     spreadsheetId=self.sheet_id,
                     range=f"{Config.SUBMISSIONS_SHEET}!A2",
                     valueInputOption='RAW',
@@ -244,33 +406,131 @@ class SheetsClient:
                         'values': [row]
                     }).execute()
 
+                # Record where the new row landed so a resubmission today
+                # updates in place without refetching the column
+                updated_range = append_result.get('updates', {}).get('updatedRange', '')
+                match = re.search(r'!A(\d+)', updated_range)
+                if match:
+                    self._row_index[(date_str, user_name)] = int(match.group(1))
+
         except Exception as e:
             logger.error(f"Error updating submissions sheet: {str(e)}")
 
+    def _queue_write(self, range_name, values):
+        """Queue one range write for the next batched flush"""
+        with self._flush_lock:
+            self._pending_updates.append({
+                'range': range_name,
+                'values': values
+            })
+        self._maybe_flush()
+
+    def _maybe_flush(self, force=False):
+        """Flush queued writes when forced, the queue is large, or enough
+        time has passed since the last flush"""
+        with self._flush_lock:
+            if not self._pending_updates:
+                return
+
+            due = (force or len(self._pending_updates) >= _FLUSH_MAX_QUEUED
+                   or time.monotonic() - self._last_flush >= _FLUSH_INTERVAL)
+            if not due:
+                # Whatever stays queued must still go out shortly even if no
+                # further writes arrive to trigger a flush
+                if self._flush_timer is None:
+                    self._flush_timer = threading.Timer(
+                        _FLUSH_INTERVAL, self._maybe_flush, kwargs={
+                            'force': True
+                        })
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+                return
+
+            data, self._pending_updates = self._pending_updates, []
+            self._last_flush = time.monotonic()
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+        # The network call happens outside the lock so concurrent
+        # submissions can keep queueing while the batch is in flight
+        try:
+            self.service.spreadsheets().values().batchUpdate(
+                spreadsheetId=self.sheet_id,
+                body={
+                    'valueInputOption': 'RAW',
+                    'data': data
+                }).execute()
+        except Exception as e:
+            logger.error(f"Error flushing queued sheet updates: {str(e)}")
+
+    def flush_submissions(self):
+        """Send all queued range updates in a single values.batchUpdate"""
+        self._maybe_flush(force=True)
+
+    def close(self):
+        """Force out any queued writes before shutdown"""
+        self._maybe_flush(force=True)
+
+    def _load_tracker_cursor(self):
+        """Read the last-processed timestamp from the _meta/tracker_cursor doc"""
+        try:
+            doc = self.firebase_client.db.collection('_meta').document('tracker_cursor').get()
+            if doc.exists:
+                return doc.to_dict().get('last_ts')
+        except Exception as e:
+            logger.error(f"Error reading tracker cursor: {str(e)}")
+        return None
+
+    def _save_tracker_cursor(self, last_ts):
+        """Persist the last-processed timestamp for the next incremental run"""
+        try:
+            self.firebase_client.db.collection('_meta').document('tracker_cursor').set(
+                {'last_ts': last_ts})
+        except Exception as e:
+            logger.error(f"Error saving tracker cursor: {str(e)}")
+
     def update_tracker(self):
-        """Update submission tracker sheet with complete historical data"""
+        """Update submission tracker sheet, reading only new reports when possible"""
         if not self.service:
             logger.error("Sheets service not initialized")
             return
 
         try:
             # Get today's date
-            today = datetime.now(ZoneInfo("America/New_York")).date()
+            today = datetime.now(_NY).date()
 
-            # Get all submissions from Firebase
+            # Get submissions from Firebase
             if not (self.firebase_client and self.firebase_client.db):
                 logger.error(
                     "Firebase client not initialized or database not accessible"
                 )
                 return
 
-            # Get all users who have ever submitted
-            users = set()
-            all_submissions = {}  # Dict of date -> set of users who submitted
-            all_dates = set()  # Track all dates with submissions
+            # Incremental read: if we have accumulated state from a previous
+            # run in this process, only stream reports newer than the
+            # persisted cursor. A cold start (empty state) rebuilds from the
+            # full collection once and then writes a fresh cursor.
+            last_ts = self._load_tracker_cursor() if _tracker_state["dates"] else None
+            # Project down to the three fields the grid needs; report bodies
+            # never leave the server
+            reports_ref = self.firebase_client.db.collection('eod_reports')\
+                .select(['user_id', 'user_name', 'timestamp'])
+            if last_ts is not None:
+                docs = reports_ref.where('timestamp', '>', last_ts)\
+                    .order_by('timestamp').stream()
+                logger.info(f"Applying tracker delta since {last_ts}")
+            else:
+                _tracker_state["users"] = set()
+                _tracker_state["submissions"] = {}
+                _tracker_state["dates"] = set()
+                docs = reports_ref.stream()
+                logger.info("Rebuilding tracker state from the full collection")
 
-            # Query ALL submissions (no date filtering)
-            docs = self.firebase_client.db.collection('eod_reports').stream()
+            users = _tracker_state["users"]
+            all_submissions = _tracker_state["submissions"]
+            all_dates = _tracker_state["dates"]
+            max_ts = last_ts
 
             for doc in docs:
                 data = doc.to_dict()
@@ -280,24 +540,16 @@ class SheetsClient:
                 if not timestamp:
                     continue
 
+                if max_ts is None or timestamp > max_ts:
+                    max_ts = timestamp
+
                 submit_date = timestamp.astimezone(
-                    ZoneInfo("America/New_York")).date()
+                    _NY).date()
                 all_dates.add(submit_date)  # Track this date
 
-                # Get user name
-                if 'user_name' not in data:
-                    try:
-                        from slack_client import SlackClient
-                        slack_client = SlackClient(
-                            Config.SLACK_BOT_OAUTH_TOKEN)
-                        user_info = slack_client.get_user_info(user_id)
-                        user_name = user_info.get(
-                            'real_name', 'Unknown') if user_info else 'Unknown'
-                    except Exception as e:
-                        logger.error(f"Error getting user info: {str(e)}")
-                        user_name = 'Unknown'
-                else:
-                    user_name = data.get('user_name')
+                # user_name is denormalized into every report at write time,
+                # so no per-doc Slack lookup is needed
+                user_name = data.get('user_name', 'Unknown')
 
                 users.add(user_name)
                 if submit_date not in all_submissions:
@@ -307,33 +559,29 @@ class SheetsClient:
             # Create headers (contractor names)
             headers = ['Date'] + sorted(list(users))
 
-            # Generate rows for ALL dates from earliest submission to today
-            new_rows = []
-
             # Find earliest date with submission
             earliest_date = min(all_dates) if all_dates else today
 
-            # Generate a row for every date from earliest to today
-            current = earliest_date
-            while current <= today:
-                row = [current.strftime('%Y-%m-%d')]
-                submitted_users = all_submissions.get(current, set())
-
-                for user in headers[1:]:
-                    if self._is_holiday(current):
-                        row.append('🏖️')  # Holiday
-                    elif self._is_weekend(current):
-                        row.append('⚫')  # Weekend
-                    elif user in submitted_users:
-                        row.append('✓')  # Submitted
-                    else:
-                        row.append('❌')  # Not submitted
-
-                new_rows.append(row)
-                current += timedelta(days=1)
+            # Generate a row for every date from earliest to today. Holiday
+            # and weekend are per-date decisions, so they're made once per
+            # row instead of once per cell; only working days pay the
+            # per-user membership test
+            names = headers[1:]
+            new_rows = []
+            total_days = (today - earliest_date).days + 1
+            for current in (earliest_date + timedelta(days=i) for i in range(total_days)):
+                if _is_holiday(current):
+                    cells = ['🏖️'] * len(names)  # Holiday
+                elif _is_weekend(current):
+                    cells = ['⚫'] * len(names)  # Weekend
+                else:
+                    submitted_users = all_submissions.get(current, set())
+                    cells = ['✓' if user in submitted_users else '❌'
+                             for user in names]
+                new_rows.append([current.strftime('%Y-%m-%d')] + cells)
 
-            # Sort rows by date in reverse chronological order (newest first)
-            new_rows.sort(key=lambda x: x[0], reverse=True)
+            # Rows were generated oldest-first; newest goes on top
+            new_rows.reverse()
 
             # Update sheet with complete data
             self.service.spreadsheets().values().update(
@@ -348,17 +596,50 @@ class SheetsClient:
                 f"Successfully updated tracker sheet with {len(new_rows)} days of data"
             )
 
+            # Advance the cursor so the next run only reads newer reports
+            if max_ts is not None:
+                _tracker_state["cursor"] = max_ts
+                self._save_tracker_cursor(max_ts)
+
         except Exception as e:
             logger.error(f"Error updating tracker sheet: {str(e)}")
             logger.error(traceback.format_exc())
 
+    def _build_tracker_rows(self, dates, header_user_ids, submitted):
+        """Build tracker grid rows for an iterable of dates.
+
+        The column index map and the per-date submitter grouping are
+        computed once up front; working-day rows start as all-❌ and only
+        the (typically small) set of that day's submitters flips cells to
+        ✓, instead of a membership test per cell.
+        """
+        idx_by_id = {uid: i for i, uid in enumerate(header_user_ids)}
+        submitted_by_date = {}
+        for submit_date, uid in submitted:
+            submitted_by_date.setdefault(submit_date, []).append(uid)
+
+        rows = []
+        for current in dates:
+            if _is_holiday(current):
+                cells = ['🏖️'] * len(header_user_ids)
+            elif _is_weekend(current):
+                cells = ['⚫'] * len(header_user_ids)
+            else:
+                cells = ['❌'] * len(header_user_ids)
+                for uid in submitted_by_date.get(current, ()):
+                    idx = idx_by_id.get(uid)
+                    if idx is not None:
+                        cells[idx] = '✓'
+            rows.append([current.strftime('%Y-%m-%d')] + cells)
+        return rows
+
     def _is_weekend(self, check_date):
         """Check if a date is a weekend"""
-        return check_date.weekday() >= 5  # Saturday = 5, Sunday = 6
+        return _is_weekend(check_date)
 
     def _is_holiday(self, check_date):
         """Check if a date is a holiday"""
-        return check_date in HOLIDAYS
+        return _is_holiday(check_date)
 
     def append_weekly_summary(self, user_id, summary, start_date, end_date):
         """Append weekly summary to the weekly summaries sheet"""
@@ -368,23 +649,12 @@ class SheetsClient:
 
         try:
             # Get user info from Slack
-            try:
-                from slack_client import SlackClient
-                slack_client = SlackClient(Config.SLACK_BOT_OAUTH_TOKEN)
-                user_info = slack_client.get_user_info(user_id)
-                user_name = user_info.get(
-                    'real_name', 'Unknown') if user_info else 'Unknown'
-                user_email = user_info.get('profile', {}).get(
-                    'email', 'Unknown') if user_info else 'Unknown'
-            except Exception as e:
-                logger.error(f"Error getting Slack user info: {str(e)}")
-                user_name = 'Unknown'
-                user_email = 'Unknown'
+            user_name, user_email = self._resolve_user(user_id)
 
             # Format dates
             date_range = f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
             timestamp = datetime.now(
-                ZoneInfo("America/New_York")).strftime('%Y-%m-%d %H:%M:%S')
+                _NY).strftime('%Y-%m-%d %H:%M:%S')
 
             # Prepare row data
             row = [timestamp, date_range, user_name, user_email, summary]
@@ -403,6 +673,110 @@ class SheetsClient:
         except Exception as e:
             logger.error(f"Error appending weekly summary to sheets: {str(e)}")
 
+    def _collect_tracker_submissions(self, docs, workspace_users,
+                                     slack_client):
+        """Reduce a stream of report docs to tracker state.
+
+        Returns (all_dates, submitted, user_id_to_name) where `submitted`
+        is a flat set of (date, user_id) pairs — ids are stable and hashing
+        a small tuple beats per-cell set lookups on variable-length names.
+        """
+        all_dates = set()
+        submitted = set()
+
+        # user_id -> resolved display name, also used to filter bots and
+        # deactivated users
+        user_id_to_name = {}
+
+        # IDs that need a users.info call, resolved in parallel after the
+        # loop instead of serially inside it
+        unresolved = set()
+
+        submission_count = 0
+        for doc in docs:
+            submission_count += 1
+            data = doc.to_dict()
+            user_id = data.get('user_id')
+            timestamp = data.get('timestamp')
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Processing document {doc.id}: user_id={user_id}, timestamp={timestamp}"
+                )
+
+            # Skip internal team members
+            if user_id in INTERNAL_TEAM_IDS:
+                continue
+
+            if not timestamp:
+                logger.warning(
+                    f"Skipping document with missing timestamp: {doc.id}")
+                continue
+
+            try:
+                submit_date = timestamp.astimezone(_NY).date()
+            except Exception as e:
+                logger.error(f"Error converting timestamp to date: {str(e)}")
+                logger.error(f"Timestamp value: {timestamp}")
+                continue
+
+            all_dates.add(submit_date)  # Track this date
+
+            # Bot/deactivated filtering comes from the one-time workspace
+            # snapshot instead of a per-document users.info call
+            member = workspace_users.get(user_id)
+            if member is not None and (member.get('is_bot', False)
+                                       or member.get('deleted', False)):
+                logger.debug(f"Skipping bot/deactivated user: {user_id}")
+                continue
+
+            # Reports carry user_name denormalized at write time; only
+            # fall back to Slack when it is missing. Lookups that need a
+            # users.info call are deferred and batched after the loop
+            user_name = data.get('user_name')
+            if not user_name or user_name == 'Unknown':
+                if member is not None:
+                    user_name = member.get('real_name', 'Unknown')
+                else:
+                    cached = self._user_name_cache.get(user_id)
+                    if cached is not None:
+                        user_name = cached[0]
+                    else:
+                        unresolved.add(user_id)
+                        user_name = None
+
+            # Store user ID to name mapping
+            if user_name is not None:
+                user_id_to_name[user_id] = user_name
+
+            submitted.add((submit_date, user_id))
+
+        # Resolve the residual unknown IDs: one bulk users.list pass
+        # prefills the client's cache, so the per-ID lookups below are
+        # dict hits except for departed users, which a small pool
+        # overlaps instead of serializing
+        unresolved -= set(user_id_to_name)
+        if unresolved:
+            ids = list(unresolved)
+            slack_client.warm_cache(ids)
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                infos = list(pool.map(slack_client.get_user_info, ids))
+            for uid, user_info in zip(ids, infos):
+                name = user_info.get('real_name',
+                                     'Unknown') if user_info else 'Unknown'
+                self._user_name_cache[uid] = (name, False)
+                user_id_to_name[uid] = name
+
+        logger.info(
+            f"Processed {submission_count} submissions from {len(user_id_to_name)} users"
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"All dates with submissions: {sorted(all_dates)}")
+            logger.debug(
+                f"Users who submitted: {sorted(user_id_to_name.values())}")
+
+        return all_dates, submitted, user_id_to_name
+
     def update_tracker_sheet(self, firebase_client=None):
         """Update submission tracker sheet with complete historical data"""
         if not self.service:
@@ -421,169 +795,160 @@ class SheetsClient:
                 return
 
             # Get today's date
-            today = datetime.now(ZoneInfo("America/New_York")).date()
+            today = datetime.now(_NY).date()
 
-            # Get all submissions from Firebase
-            docs = list(fb_client.db.collection('eod_reports').stream())
-            logger.info(f"Retrieved {len(docs)} documents from Firebase")
+            # One shared Slack client for the whole pass, so every cache miss
+            # reuses the same HTTP session
+            slack_client = self._get_slack_client()
 
-            # Process submission data
-            all_dates = set()
-            all_submissions = {}
-            users = set()
+            # A single users.list snapshot replaces per-document users.info
+            # calls for bot/deactivated filtering and name fallback
+            workspace_users = self._fetch_workspace_users(slack_client)
 
-            # Track user IDs to filter out bots and deactivated users
-            user_id_to_name = {}
+            # Read the sheet's current header row and newest data row first,
+            # so both the Firestore read and the write can be scoped to the
+            # delta since the last run
+            existing = self.service.spreadsheets().values().get(
+                spreadsheetId=self.sheet_id,
+                range='Submission Tracker!1:2').execute().get('values', [])
+            existing_headers = existing[0] if existing else []
+            top_date = None
+            if len(existing) > 1 and existing[1]:
+                try:
+                    top_date = datetime.strptime(existing[1][0],
+                                                 '%Y-%m-%d').date()
+                except ValueError:
+                    top_date = None
 
+            sheet_gid = self._get_sheet_id('Submission Tracker')
 
+            incremental = (len(existing_headers) > 1 and top_date is not None
+                           and top_date <= today and sheet_gid is not None)
 
-            logger.info("Processing submission data")
-            submission_count = 0
-            for doc in docs:
-                submission_count += 1
-                data = doc.to_dict()
-                user_id = data.get('user_id')
-                timestamp = data.get('timestamp')
+            # Project down to the three fields the grid needs; report bodies
+            # never leave the server
+            reports_ref = fb_client.db.collection('eod_reports')\
+                .select(['user_id', 'user_name', 'timestamp'])
 
-                logger.info(
-                    f"Processing document {doc.id}: user_id={user_id}, timestamp={timestamp}"
-                )
-
-                # Skip internal team members
-                if user_id in INTERNAL_TEAM_IDS:
-                    logger.info(f"Skipping internal team member: {user_id}")
-                    continue
+            logger.info("Processing submission data")
+            if incremental:
+                # Push the date filter down to Firestore: only reports from
+                # the sheet's newest rendered day onwards can change anything
+                since = datetime(top_date.year, top_date.month, top_date.day,
+                                 tzinfo=_NY)
+                docs = reports_ref.where('timestamp', '>=', since).stream()
+            else:
+                docs = reports_ref.stream()
 
-                if not timestamp:
-                    logger.warning(
-                        f"Skipping document with missing timestamp: {doc.id}")
-                    continue
+            all_dates, submitted, user_id_to_name = \
+                self._collect_tracker_submissions(docs, workspace_users,
+                                                  slack_client)
 
-                # Log the timestamp type and value
+            if incremental and not set(user_id_to_name.values()) <= set(
+                    existing_headers[1:]):
+                # A contractor not yet in the header row submitted; the
+                # column set changed, so rebuild from the full history
                 logger.info(
-                    f"Timestamp type: {type(timestamp)}, value: {timestamp}")
-
-                try:
-                    submit_date = timestamp.astimezone(
-                        ZoneInfo("America/New_York")).date()
-                    logger.info(f"Converted timestamp to date: {submit_date}")
-                except Exception as e:
-                    logger.error(
-                        f"Error converting timestamp to date: {str(e)}")
-                    logger.error(f"Timestamp value: {timestamp}")
-                    continue
-
-                all_dates.add(submit_date)  # Track this date
-
-                # Get user name and check if bot or deactivated
-                try:
-                    from slack_client import SlackClient
-                    slack_client = SlackClient(
-                        Config.SLACK_BOT_OAUTH_TOKEN)
-                    user_info = slack_client.get_user_info(user_id)
-
-                    # Skip if user is a bot
-                    if user_info and user_info.get('is_bot', False):
-                        logger.info(f"Skipping bot user: {user_id}")
-                        continue
-
-                    # Skip if user is deactivated
-                    if user_info and user_info.get('deleted', False):
-                        logger.info(
-                            f"Skipping deactivated user: {user_id}")
-                        continue
-
-                    user_name = user_info.get(
-                        'real_name', 'Unknown') if user_info else data.get(
-                            'user_name', 'Unknown')
+                    "New contractors since last run; rebuilding full tracker")
+                incremental = False
+                all_dates, submitted, user_id_to_name = \
+                    self._collect_tracker_submissions(reports_ref.stream(),
+                                                      workspace_users,
+                                                      slack_client)
+
+            if incremental:
+                # Keep the sheet's existing columns and map each header name
+                # back to its user ID (recent submitters first, then the
+                # workspace snapshot; departed users simply never match)
+                name_to_id = {
+                    member.get('real_name'): member_id
+                    for member_id, member in workspace_users.items()
+                }
+                name_to_id.update(
+                    (name, uid) for uid, name in user_id_to_name.items())
+                headers = existing_headers
+                header_user_ids = [
+                    name_to_id.get(name) for name in existing_headers[1:]
+                ]
+            else:
+                # Create headers (contractor names, sorted) with a parallel
+                # list of the user IDs behind each column
+                header_items = sorted(user_id_to_name.items(),
+                                      key=lambda kv: kv[1])
+                header_user_ids = [uid for uid, _ in header_items]
+                headers = ['Date'] + [name for _, name in header_items]
+                logger.debug(
+                    f"Created headers with {len(headers)} columns: {headers}")
+
+            if incremental:
+                if top_date == today:
+                    # Same day: only the top row can have changed
+                    rows = self._build_tracker_rows([today], header_user_ids,
+                                                    submitted)
+                    self.service.spreadsheets().values().update(
+                        spreadsheetId=self.sheet_id,
+                        range='Submission Tracker!A2',
+                        valueInputOption='RAW',
+                        body={
+                            'values': rows
+                        }).execute()
+                    logger.info("Refreshed today's tracker row in place")
+                else:
+                    # Missed days: shift history down and write only the
+                    # window between the stored top date and today
+                    delta_dates = [
+                        top_date + timedelta(days=i)
+                        for i in range(1, (today - top_date).days + 1)
+                    ]
+                    delta_rows = self._build_tracker_rows(
+                        reversed(delta_dates), header_user_ids, submitted)
+                    self.service.spreadsheets().batchUpdate(
+                        spreadsheetId=self.sheet_id,
+                        body={
+                            'requests': [{
+                                'insertDimension': {
+                                    'range': {
+                                        'sheetId': sheet_gid,
+                                        'dimension': 'ROWS',
+                                        'startIndex': 1,
+                                        'endIndex': 1 + len(delta_rows)
+                                    },
+                                    'inheritFromBefore': False
+                                }
+                            }]
+                        }).execute()
+                    self.service.spreadsheets().values().update(
+                        spreadsheetId=self.sheet_id,
+                        range='Submission Tracker!A2',
+                        valueInputOption='RAW',
+                        body={
+                            'values': delta_rows
+                        }).execute()
                     logger.info(
-                        f"Retrieved user name: {user_name} for user_id: {user_id}"
-                    )
-
-                    # Store user ID to name mapping
-                    user_id_to_name[user_id] = user_name
-
-                except Exception as e:
-                    logger.error(f"Error getting user info: {str(e)}")
-                    user_name = data.get('user_name', 'Unknown')
-
-                users.add(user_name)
-                if submit_date not in all_submissions:
-                    all_submissions[submit_date] = set()
-                all_submissions[submit_date].add(user_name)
-                logger.info(
-                    f"Added {user_name} to submissions for {submit_date}")
-
-            logger.info(
-                f"Processed {submission_count} submissions from {len(users)} users"
-            )
-            logger.info(f"All dates with submissions: {sorted(all_dates)}")
-            logger.info(
-                f"Submission dates in tracking dict: {sorted(all_submissions.keys())}"
-            )
-            logger.info(f"Users who submitted: {sorted(users)}")
-
-            # Create headers (contractor names)
-            headers = ['Date'] + sorted(list(users))
-            logger.info(
-                f"Created headers with {len(headers)} columns: {headers}")
-
-            # Generate rows for ALL dates from earliest submission to today
-            new_rows = []
+                        f"Prepended {len(delta_rows)} new tracker rows")
+            else:
+                # Full rebuild: first run, a new/renamed contractor changed
+                # the header row, or the sheet is in an unexpected state
+                earliest_date = min(all_dates) if all_dates else today
+                logger.info(f"Earliest date with submission: {earliest_date}")
 
-            # Find earliest date with submission
-            earliest_date = min(all_dates) if all_dates else today
-            logger.info(f"Earliest date with submission: {earliest_date}")
+                total_days = (today - earliest_date).days + 1
+                new_rows = self._build_tracker_rows(
+                    (earliest_date + timedelta(days=i)
+                     for i in range(total_days)), header_user_ids, submitted)
 
-            # Generate a row for every date from earliest to today
-            current = earliest_date
-            date_count = 0
-            logger.info(f"Generating rows from {earliest_date} to {today}")
+                # Ensure newest date is at the top
+                new_rows.reverse()
 
-            while current <= today:
-                date_count += 1
-                row = [current.strftime('%Y-%m-%d')]
-                submitted_users = all_submissions.get(current, set())
                 logger.info(
-                    f"For date {current}, submitted users: {sorted(submitted_users) if submitted_users else 'None'}"
-                )
-
-                for user in headers[1:]:
-                    if self._is_holiday(current):
-                        row.append('🏖️')  # Holiday
-                        logger.info(
-                            f"Marking holiday for user {user} on {current}")
-                    elif self._is_weekend(current):
-                        row.append('⚫')  # Weekend
-                        logger.info(
-                            f"Marking weekend for user {user} on {current}")
-                    elif user in submitted_users:
-                        row.append('✓')  # Submitted
-                        logger.info(f"User {user} submitted for {current}")
-                    else:
-                        row.append('❌')  # Not submitted
-                        logger.info(
-                            f"User {user} did NOT submit for {current}")
-
-                new_rows.append(row)
-                current += timedelta(days=1)
-
-            logger.info(f"Generated {date_count} rows of data")
-
-            # Ensure newest date is at the top
-            new_rows.reverse()
-            logger.info("Reversed rows to ensure newest date is at the top")
-
-            # Update sheet
-            logger.info(
-                f"Updating Google Sheet with {len(new_rows)} rows of data")
-            self.service.spreadsheets().values().update(
-                spreadsheetId=self.sheet_id,
-                range='Submission Tracker!A1',
-                valueInputOption='RAW',
-                body={
-                    'values': [headers] + new_rows
-                }).execute()
+                    f"Updating Google Sheet with {len(new_rows)} rows of data")
+                self.service.spreadsheets().values().update(
+                    spreadsheetId=self.sheet_id,
+                    range='Submission Tracker!A1',
+                    valueInputOption='RAW',
+                    body={
+                        'values': [headers] + new_rows
+                    }).execute()
 
             logger.info("Tracker sheet update complete")
         except Exception as e:
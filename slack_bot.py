@@ -1,36 +1,253 @@
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_handlers import (
+    ConnectionErrorRetryHandler, RateLimitErrorRetryHandler)
 from config import Config
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from google.cloud import firestore
+from scheduler import today_utc_window, _NY
+from collections import deque
 import logging
 import json
+import queue
+import threading
 from functools import lru_cache
 import time
 
 logger = logging.getLogger(__name__)
 
+# Channel names come from env-backed Config attrs fixed at process start,
+# so resolve the attribute chains once instead of on every post
+_WEEKLY_CHANNEL = Config.SLACK_WEEKLY_SUMMARY_CHANNEL
+_EOD_CHANNEL = Config.SLACK_CHANNEL
+
+# Reminder text is identical for every recipient; build it once
+_REMINDER_TEXT = "Reminder: You haven't submitted your EOD report yet!"
+
+# Channel-post layout, stripped once at import; each report is a single
+# format_map over this template instead of a per-call f-string rebuild
+_REPORT_TEMPLATE = """
+        *EOD Report from <@{user_id}>*
+        *Short-term Projects:*
+        {short_term_projects}
+
+        *Long-term Projects:*
+        {long_term_projects}
+
+        *Blockers/Challenges:*
+        {blockers}
+
+        *Tomorrow's Goals:*
+        {next_day_goals}
+
+        *Software Tools Used Today:*
+        {tools_used}
+
+        *Client Feedback:*
+        {client_feedback}
+
+        *Need Help?*
+        {help_needed}
+        """.strip()
+
+
+# (block_id, action_id, label, placeholder, multiline, data_key) for each
+# modal input; _build_modal_blocks expands this instead of repeating the
+# same nested-dict literal seven times
+_MODAL_FIELDS = (
+    ("short_term_block", "short_term_input", "Short-term Projects",
+     "What did you work on today?", True, "short_term_projects"),
+    ("long_term_block", "long_term_input", "Long-term Projects",
+     "Any progress on longer-term initiatives?", True, "long_term_projects"),
+    ("blockers_block", "blockers_input", "Blockers",
+     "Any challenges or blockers?", True, "blockers"),
+    ("goals_block", "goals_input", "Next Day Goals",
+     "What are your goals for tomorrow?", True, "next_day_goals"),
+    ("tools_block", "tools_input", "Tools Used",
+     "What tools/technologies did you use today?", False, "tools_used"),
+    ("help_block", "help_input", "Help Needed",
+     "Do you need any help or support?", True, "help_needed"),
+    ("client_feedback_block", "client_feedback_input", "Client Feedback",
+     "Any feedback received from clients?", True, "client_feedback"),
+)
+
+
+def _build_modal_blocks(existing_data=None):
+    """Build the EOD modal input blocks, prefilled from existing_data"""
+    blocks = []
+    for block_id, action_id, label, placeholder, multiline, data_key in _MODAL_FIELDS:
+        element = {
+            "type": "plain_text_input",
+            "action_id": action_id,
+        }
+        if multiline:
+            element["multiline"] = True
+        element["initial_value"] = existing_data.get(data_key, '') if existing_data else ''
+        element["placeholder"] = {"type": "plain_text", "text": placeholder}
+        blocks.append({
+            "type": "input",
+            "block_id": block_id,
+            "label": {"type": "plain_text", "text": label},
+            "element": element,
+        })
+    return blocks
+
+
+def _build_modal_view(private_metadata=None, existing_data=None):
+    """Build the full EOD modal view dict"""
+    return {
+        "type": "modal",
+        "callback_id": "eod_submission",
+        "title": {"type": "plain_text", "text": "EOD Report"},
+        "submit": {"type": "plain_text", "text": "Submit"},
+        "close": {"type": "plain_text", "text": "Cancel"},
+        "blocks": _build_modal_blocks(existing_data),
+        "private_metadata": private_metadata or ""
+    }
+
+
+# View/Edit buttons for the already-submitted message; fully static, so
+# shared across calls instead of rebuilt (the client only serializes it)
+_ALREADY_SUBMITTED_ACTIONS_BLOCK = {
+    "type": "actions",
+    "block_id": "already_submitted_actions",
+    "elements": [
+        {
+            "type": "button",
+            "text": {
+                "type": "plain_text",
+                "text": "View",
+                "emoji": True
+            },
+            "style": "primary",
+            "value": "view_report",
+            "action_id": "view_report"
+        },
+        {
+            "type": "button",
+            "text": {
+                "type": "plain_text",
+                "text": "Edit",
+                "emoji": True
+            },
+            "style": "primary",
+            "value": "edit_report",
+            "action_id": "edit_report"
+        }
+    ]
+}
+
+# The empty modal is fully static, so build it once at import instead of
+# re-allocating dozens of nested dicts every time a user opens it
+_EOD_MODAL_VIEW = _build_modal_view()
+
+# Serialized once as well; the SDK passes a string view straight through,
+# skipping the per-call json.dumps of the whole nested structure
+_EOD_MODAL_JSON = json.dumps(_EOD_MODAL_VIEW, separators=(',', ':'))
+
+
+class _RateLimiter:
+    """Sliding-window throttle for outbound Slack posts.
+
+    Slack allows roughly one chat.postMessage per second per channel;
+    instead of blasting a burst and bouncing off 429s, acquire() keeps a
+    deque of recent send times per bucket and sleeps until the oldest
+    falls out of the window when the bucket is full. Distinct buckets
+    (e.g. DMs to different users) never wait on each other.
+    """
+
+    def __init__(self, max_calls=1, window=1.0):
+        self._max_calls = max_calls
+        self._window = window
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, bucket):
+        while True:
+            with self._lock:
+                stamps = self._buckets.setdefault(bucket, deque())
+                now = time.monotonic()
+                while stamps and now - stamps[0] >= self._window:
+                    stamps.popleft()
+                if len(stamps) < self._max_calls:
+                    stamps.append(now)
+                    return
+                wait = stamps[0] + self._window - now
+            # Sleep outside the lock so other buckets keep moving
+            time.sleep(wait)
+
+
+# One WebClient per process: the SDK client is thread-safe and owns an
+# HTTP keepalive pool, so sharing it keeps connections warm instead of
+# redoing the TLS handshake whenever a SlackBot is constructed
+_web_client = None
+
+
+def _get_web_client():
+    """Return the process-wide WebClient, creating it on first use"""
+    global _web_client
+    if _web_client is None:
+        # Retry transient failures instead of dropping messages: 429s wait
+        # out Retry-After and connection errors back off, both bounded
+        _web_client = WebClient(
+            token=Config.SLACK_BOT_OAUTH_TOKEN,
+            retry_handlers=[
+                ConnectionErrorRetryHandler(max_retry_count=3),
+                RateLimitErrorRetryHandler(max_retry_count=8),
+            ])
+    return _web_client
+
+
 class SlackBot:
     def __init__(self):
-        self.client = WebClient(token=Config.SLACK_BOT_OAUTH_TOKEN)
-        self._ensure_in_channels()
+        self.client = _get_web_client()
+        # Channel join is deferred to first use so constructing the bot
+        # (which happens at app import) costs no network round-trip
+        self._channels_ensured = False
         self._user_cache = {}  # Cache for user info
         self._cache_expiry = 3600  # Cache expiry in seconds (1 hour)
+        self._channel_id_cache = {}  # name -> (channel_id, cached_at)
+        self._channel_cache_ttl = 300  # Channel list barely changes; 5 min
+        self._users_snapshot = (None, 0.0)  # ({user_id: member}, cached_at)
+        self._post_limiter = _RateLimiter()  # Per-channel postMessage pacing
+        self._joined = set()  # Channels we know the bot is a member of
+        self._firebase = None  # Resolved lazily from app to avoid circulars
+
+        # Background send queue: request handlers enqueue and return
+        # instead of holding their thread for the Slack round-trip. The
+        # worker is started lazily on first use
+        self._send_queue = None
+        self._send_worker = None
+        self._send_lock = threading.Lock()
+
+    def _get_firebase_client(self):
+        """Get the app's shared Firebase client, imported once on first use"""
+        if self._firebase is None:
+            # Imported here to avoid circular imports; cached so the hot
+            # paths skip the per-call import machinery afterwards
+            from app import firebase_client
+            self._firebase = firebase_client
+        return self._firebase
     
     def _ensure_in_channels(self):
-        """Ensure bot is in required channels"""
+        """Ensure bot is in required channels (once per process, lazily)"""
+        if self._channels_ensured:
+            return
+        self._channels_ensured = True
         try:
             # Try to join the weekly summary channel
             try:
                 response = self.client.conversations_join(
-                    channel=Config.SLACK_WEEKLY_SUMMARY_CHANNEL
+                    channel=_WEEKLY_CHANNEL
                 )
                 if response['ok']:
-                    logger.info(f"Successfully joined channel {Config.SLACK_WEEKLY_SUMMARY_CHANNEL}")
+                    logger.info("Successfully joined channel %s", _WEEKLY_CHANNEL)
             except SlackApiError as e:
                 if e.response['error'] == 'is_archived':
-                    logger.error(f"Channel {Config.SLACK_WEEKLY_SUMMARY_CHANNEL} is archived")
+                    logger.error(f"Channel {_WEEKLY_CHANNEL} is archived")
                 elif e.response['error'] == 'channel_not_found':
-                    logger.error(f"Channel {Config.SLACK_WEEKLY_SUMMARY_CHANNEL} not found. Please create it and invite the bot.")
+                    logger.error(f"Channel {_WEEKLY_CHANNEL} not found. Please create it and invite the bot.")
                 else:
                     logger.error(f"Error joining channel: {e.response['error']}")
         except Exception as e:
@@ -39,12 +256,13 @@ class SlackBot:
     def send_eod_prompt(self, trigger_id, private_metadata=None, existing_data=None):
         """Send EOD report modal"""
         try:
-            logger.debug(f"Opening modal with trigger_id: {trigger_id}")
+            logger.debug("Opening modal with trigger_id: %s", trigger_id)
             
             # Build modal view
             view = self._build_eod_modal(private_metadata, existing_data)
 
-            logger.debug(f"Sending modal view: {json.dumps(view, indent=2)}")
+            # view may already be a pre-serialized string
+            logger.debug("Sending modal view: %s", view)
             
             # Open the modal
             response = self.client.views_open(
@@ -63,25 +281,99 @@ class SlackBot:
     def send_reminder(self, user_id):
         """Send reminder for missing EOD report"""
         try:
+            self._post_limiter.acquire(user_id)
             self.client.chat_postMessage(
                 channel=user_id,
-                text="Reminder: You haven't submitted your EOD report yet!"
+                text=_REMINDER_TEXT
             )
         except SlackApiError as e:
             logger.error(f"Error sending reminder: {e.response['error']}")
-    
+
+    def send_reminder_batch(self, user_ids, max_workers=4):
+        """Send reminders to several users concurrently.
+
+        Each send is an independent Slack round-trip, so a small thread
+        pool overlaps the network waits and the broadcast finishes in
+        roughly ceil(N / workers) round-trips instead of N.
+        """
+        user_ids = list(user_ids)
+        if not user_ids:
+            return
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            list(pool.map(self.send_reminder, user_ids))
+
+    def schedule_reminder_batch(self, user_ids, post_at=None):
+        """Schedule reminders via chat.scheduleMessage.
+
+        Each call just enqueues the message on Slack's side; delivery and
+        its pacing happen in their backend, so the bot is not the one
+        absorbing rate-limit pressure during the broadcast. Returns the
+        user IDs that could not be scheduled.
+        """
+        if post_at is None:
+            post_at = int(time.time()) + 5
+
+        failed_users = []
+        for user_id in user_ids:
+            try:
+                self.client.chat_scheduleMessage(
+                    channel=user_id,
+                    post_at=post_at,
+                    text=_REMINDER_TEXT
+                )
+            except SlackApiError as e:
+                logger.error(
+                    f"Error scheduling reminder for {user_id}: {e.response['error']}")
+                failed_users.append(user_id)
+        return failed_users
+
+
+    def queue_message(self, **message_params):
+        """Queue a chat.postMessage for the background sender.
+
+        The caller returns immediately; a single worker thread drains the
+        queue in order, so messages to the same channel keep their
+        relative ordering. Send failures are logged by the worker.
+        """
+        with self._send_lock:
+            if self._send_queue is None:
+                self._send_queue = queue.Queue()
+                self._send_worker = threading.Thread(
+                    target=self._drain_send_queue,
+                    daemon=True,
+                    name='slack-sender')
+                self._send_worker.start()
+        self._send_queue.put(message_params)
+
+    def _drain_send_queue(self):
+        """Worker loop: send queued messages one at a time, in order"""
+        while True:
+            message_params = self._send_queue.get()
+            try:
+                self._post_limiter.acquire(message_params.get('channel'))
+                self.client.chat_postMessage(**message_params)
+            except SlackApiError as e:
+                logger.error(
+                    f"Error sending queued message: {e.response['error']}")
+            except Exception as e:
+                logger.error(f"Error sending queued message: {str(e)}")
+            finally:
+                self._send_queue.task_done()
+
     def post_report_to_channel(self, report_data):
         """Post EOD report to designated channel"""
         try:
-            channel = Config.SLACK_CHANNEL
+            channel = _EOD_CHANNEL
             formatted_report = self._format_report_for_channel(report_data)
-            
-            self.client.chat_postMessage(
+
+            # Formatting/validation stays synchronous; the network send
+            # happens off the request thread
+            self.queue_message(
                 channel=channel,
                 text=formatted_report,
                 parse='mrkdwn'
             )
-            logger.info(f"Posted report to channel {channel}")
+            logger.info("Queued report for channel %s", channel)
         except SlackApiError as e:
             logger.error(f"Error posting report to channel: {e.response['error']}")
     
@@ -92,41 +384,103 @@ class SlackBot:
     def send_message(self, channel_id, text, thread_ts=None):
         """Send a simple message to a channel or user"""
         try:
-            # If it's a channel (starts with 'C'), try to join it first
-            if channel_id.startswith('C'):
+            # If it's a channel (starts with 'C'), join on first use only;
+            # membership is cached so repeat sends skip the extra API call
+            if channel_id.startswith('C') and channel_id not in self._joined:
                 try:
                     self.client.conversations_join(channel=channel_id)
-                    logger.info(f"Joined channel {channel_id}")
+                    self._joined.add(channel_id)
+                    logger.info("Joined channel %s", channel_id)
                 except SlackApiError as e:
-                    if e.response['error'] != 'already_in_channel':
+                    if e.response['error'] == 'already_in_channel':
+                        self._joined.add(channel_id)
+                    else:
                         logger.error(f"Error joining channel: {e.response['error']}")
-            
+
             message_params = {
                 'channel': channel_id,
                 'text': text
             }
             if thread_ts:
                 message_params['thread_ts'] = thread_ts
-                
-            self.client.chat_postMessage(**message_params)
+
+            self._post_limiter.acquire(channel_id)
+            try:
+                self.client.chat_postMessage(**message_params)
+            except SlackApiError as e:
+                if e.response['error'] != 'not_in_channel':
+                    raise
+                # Membership cache was stale (e.g. bot was removed); rejoin
+                # and retry once
+                self._joined.discard(channel_id)
+                self.client.conversations_join(channel=channel_id)
+                self._joined.add(channel_id)
+                self.client.chat_postMessage(**message_params)
         except SlackApiError as e:
             logger.error(f"Error sending message: {e.response['error']}")
             
-    def send_status_update(self, user_id):
-        """Send status update to user"""
+    def send_status_update(self, user_id, submitted_today=None):
+        """Send status update to user.
+
+        Batch callers pass the set from get_submission_statuses so each
+        user costs one membership test; the today-window and query below
+        then run once per batch instead of once per user.
+        """
         try:
-            from models import EODReport
-            today_report = EODReport.query.filter_by(
-                user_id=user_id,
-                created_at=datetime.utcnow().date()
-            ).first()
-            
-            status = "You have submitted your EOD report for today." if today_report else "You haven't submitted your EOD report for today yet."
+            if submitted_today is not None:
+                has_report = user_id in submitted_today
+            else:
+                firebase_client = self._get_firebase_client()
+                if not (firebase_client and firebase_client.db):
+                    raise RuntimeError("Firebase client not initialized")
+
+                # Half-open range on the indexed timestamp field: one index
+                # seek capped at a single document, instead of comparing a
+                # datetime column against a date
+                start_utc, end_utc = today_utc_window(datetime.now(_NY).date())
+                today_docs = firebase_client.db.collection('eod_reports')\
+                    .select(['user_id'])\
+                    .where(filter=firestore.FieldFilter('user_id', '==', user_id))\
+                    .where(filter=firestore.FieldFilter('timestamp', '>=', start_utc))\
+                    .where(filter=firestore.FieldFilter('timestamp', '<=', end_utc))\
+                    .limit(1).stream()
+                has_report = next(iter(today_docs), None) is not None
+
+            status = "You have submitted your EOD report for today." if has_report else "You haven't submitted your EOD report for today yet."
             self.send_message(user_id, status)
         except Exception as e:
             logger.error(f"Error sending status update: {str(e)}")
             self.send_message(user_id, "Sorry, I couldn't fetch your status right now.")
     
+    def get_submission_statuses(self, user_ids):
+        """Return the subset of user_ids that have submitted today.
+
+        One projected range query covers the whole batch, so callers
+        looping over users check membership in the returned set instead
+        of issuing a per-user lookup.
+        """
+        try:
+            firebase_client = self._get_firebase_client()
+            if not (firebase_client and firebase_client.db):
+                return set()
+
+            start_utc, end_utc = today_utc_window(datetime.now(_NY).date())
+            submitted = set()
+            today_docs = firebase_client.db.collection('eod_reports')\
+                .select(['user_id'])\
+                .where(filter=firestore.FieldFilter('timestamp', '>=', start_utc))\
+                .where(filter=firestore.FieldFilter('timestamp', '<=', end_utc))\
+                .stream()
+            for doc in today_docs:
+                doc_user_id = doc.to_dict().get('user_id')
+                if doc_user_id:
+                    submitted.add(doc_user_id)
+
+            return submitted & set(user_ids)
+        except Exception as e:
+            logger.error(f"Error getting submission statuses: {str(e)}")
+            return set()
+
     def send_help_message(self, user_id):
         """Send help message with bot instructions"""
         try:
@@ -161,88 +515,45 @@ class SlackBot:
         for field in required_fields:
             if not report_data.get(field):
                 raise ValueError(f"Missing required field: {field}")
-        
-        # Format the report with all fields
-        return f"""
-        *EOD Report from <@{report_data['user_id']}>*
-        *Short-term Projects:*
-        {report_data['short_term_projects']}
-
-        *Long-term Projects:*
-        {report_data['long_term_projects']}
-
-        *Blockers/Challenges:*
-        {report_data['blockers']}
 
-        *Tomorrow's Goals:*
-        {report_data['next_day_goals']}
-
-        *Software Tools Used Today:*
-        {report_data['tools_used']}
-
-        *Client Feedback:*
-        {report_data['client_feedback']}
+        # Format the report with all fields
+        return _REPORT_TEMPLATE.format_map(report_data)
 
-        *Need Help?*
-        {report_data['help_needed']}
-        """.strip()
-    
     def _format_dict_items(self, items):
         if not items:
             return "None reported"
-        return "\n".join([f" {item}" for item in items.values()])
+        return "\n".join(f" {item}" for item in items.values())
     
     def send_already_submitted_message(self, channel_id, user_id, date):
         """Send message indicating report was already submitted with interactive buttons"""
         try:
-            logger.debug(f"Sending already submitted message to channel {channel_id} for user {user_id}")
+            logger.debug("Sending already submitted message to channel %s for user %s", channel_id, user_id)
+            # Format the date once; only the section text varies per call,
+            # the actions block is the shared module-level constant
+            message_text = f"Your EOD Report has already been submitted for {date.strftime('%B %d, %Y')}"
             blocks = [
                 {
                     "type": "section",
                     "text": {
                         "type": "mrkdwn",
-                        "text": f"Your EOD Report has already been submitted for {date.strftime('%B %d, %Y')}"
+                        "text": message_text
                     }
                 },
-                {
-                    "type": "actions",
-                    "block_id": "already_submitted_actions",
-                    "elements": [
-                        {
-                            "type": "button",
-                            "text": {
-                                "type": "plain_text",
-                                "text": "View",
-                                "emoji": True
-                            },
-                            "style": "primary",
-                            "value": "view_report",
-                            "action_id": "view_report"
-                        },
-                        {
-                            "type": "button",
-                            "text": {
-                                "type": "plain_text",
-                                "text": "Edit",
-                                "emoji": True
-                            },
-                            "style": "primary",
-                            "value": "edit_report",
-                            "action_id": "edit_report"
-                        }
-                    ]
-                }
+                _ALREADY_SUBMITTED_ACTIONS_BLOCK
             ]
-            
+
             # Send as an ephemeral message in the channel where command was triggered
             response = self.client.chat_postEphemeral(
                 channel=channel_id,
                 user=user_id,
                 blocks=blocks,
-                text=f"Your EOD Report has already been submitted for {date.strftime('%B %d, %Y')}"  # Fallback text
+                text=message_text  # Fallback text
             )
-            logger.debug(f"Slack API Response: {response}")
-            logger.info(f"Sent already submitted message in channel {channel_id} to user {user_id}")
+            # Log just the useful identifiers; repr of the full response
+            # echoes the blocks back as a multi-KB string
+            logger.debug("Slack API Response ok=%s ts=%s",
+                         response.get('ok'), response.get('message_ts'))
+            logger.info("Sent already submitted message in channel %s to user %s", channel_id, user_id)
         except SlackApiError as e:
             logger.error(f"Error sending already submitted message: {e.response['error']}")
     
@@ -260,137 +571,118 @@ class SlackBot:
     
     def _build_eod_modal(self, private_metadata=None, existing_data=None):
         """Build EOD report modal view"""
-        blocks = [
-            {
-                "type": "input",
-                "block_id": "short_term_block",
-                "label": {"type": "plain_text", "text": "Short-term Projects"},
-                "element": {
-                    "type": "plain_text_input",
-                    "action_id": "short_term_input",
-                    "multiline": True,
-                    "initial_value": existing_data.get('short_term_projects', '') if existing_data else '',
-                    "placeholder": {"type": "plain_text", "text": "What did you work on today?"}
-                }
-            },
-            {
-                "type": "input",
-                "block_id": "long_term_block",
-                "label": {"type": "plain_text", "text": "Long-term Projects"},
-                "element": {
-                    "type": "plain_text_input",
-                    "action_id": "long_term_input",
-                    "multiline": True,
-                    "initial_value": existing_data.get('long_term_projects', '') if existing_data else '',
-                    "placeholder": {"type": "plain_text", "text": "Any progress on longer-term initiatives?"}
-                }
-            },
-            {
-                "type": "input",
-                "block_id": "blockers_block",
-                "label": {"type": "plain_text", "text": "Blockers"},
-                "element": {
-                    "type": "plain_text_input",
-                    "action_id": "blockers_input",
-                    "multiline": True,
-                    "initial_value": existing_data.get('blockers', '') if existing_data else '',
-                    "placeholder": {"type": "plain_text", "text": "Any challenges or blockers?"}
-                }
-            },
-            {
-                "type": "input",
-                "block_id": "goals_block",
-                "label": {"type": "plain_text", "text": "Next Day Goals"},
-                "element": {
-                    "type": "plain_text_input",
-                    "action_id": "goals_input",
-                    "multiline": True,
-                    "initial_value": existing_data.get('next_day_goals', '') if existing_data else '',
-                    "placeholder": {"type": "plain_text", "text": "What are your goals for tomorrow?"}
-                }
-            },
-            {
-                "type": "input",
-                "block_id": "tools_block",
-                "label": {"type": "plain_text", "text": "Tools Used"},
-                "element": {
-                    "type": "plain_text_input",
-                    "action_id": "tools_input",
-                    "initial_value": existing_data.get('tools_used', '') if existing_data else '',
-                    "placeholder": {"type": "plain_text", "text": "What tools/technologies did you use today?"}
-                }
-            },
-            {
-                "type": "input",
-                "block_id": "help_block",
-                "label": {"type": "plain_text", "text": "Help Needed"},
-                "element": {
-                    "type": "plain_text_input",
-                    "action_id": "help_input",
-                    "multiline": True,
-                    "initial_value": existing_data.get('help_needed', '') if existing_data else '',
-                    "placeholder": {"type": "plain_text", "text": "Do you need any help or support?"}
-                }
-            },
-            {
-                "type": "input",
-                "block_id": "client_feedback_block",
-                "label": {"type": "plain_text", "text": "Client Feedback"},
-                "element": {
-                    "type": "plain_text_input",
-                    "action_id": "client_feedback_input",
-                    "multiline": True,
-                    "initial_value": existing_data.get('client_feedback', '') if existing_data else '',
-                    "placeholder": {"type": "plain_text", "text": "Any feedback received from clients?"}
-                }
-            }
-        ]
+        if existing_data:
+            return _build_modal_view(private_metadata, existing_data)
+        if not private_metadata:
+            # Pre-serialized: views_open sends the string as-is
+            return _EOD_MODAL_JSON
+        # Static blocks, caller-specific metadata
+        view = dict(_EOD_MODAL_VIEW)
+        view["private_metadata"] = private_metadata
+        return view
 
-        return {
-            "type": "modal",
-            "callback_id": "eod_submission",
-            "title": {"type": "plain_text", "text": "EOD Report"},
-            "submit": {"type": "plain_text", "text": "Submit"},
-            "close": {"type": "plain_text", "text": "Cancel"},
-            "blocks": blocks,
-            "private_metadata": private_metadata or ""
-        }
+    def _load_users(self):
+        """Return {user_id: member} for the whole workspace, cached with TTL.
+
+        One paginated users.list carries is_bot/deleted for every user,
+        so callers filter locally instead of issuing a users.info per
+        member.
+        """
+        snapshot, cached_at = self._users_snapshot
+        if snapshot is not None and time.time() - cached_at < self._cache_expiry:
+            return snapshot
+
+        users = {}
+        cursor = None
+        while True:
+            response = self.client.users_list(limit=1000, cursor=cursor)
+            for member in response['members']:
+                users[member['id']] = member
+            cursor = response.get('response_metadata', {}).get('next_cursor')
+            if not cursor:
+                break
+        self._users_snapshot = (users, time.time())
+        return users
 
     def get_channel_members(self, channel_id):
         """Get list of members in a channel"""
         try:
-            # Get channel info including members
-            response = self.client.conversations_members(channel=channel_id)
-            members = response['members']
-            
-            # Filter out bots and inactive users
+            # conversations_members caps each page, so follow the cursor;
+            # a single unpaginated call silently drops members in larger
+            # channels
+            members = []
+            cursor = None
+            while True:
+                response = self.client.conversations_members(
+                    channel=channel_id, cursor=cursor)
+                members.extend(response['members'])
+                cursor = response.get('response_metadata', {}).get('next_cursor')
+                if not cursor:
+                    break
+
+            # Filter out bots and inactive users against the cached
+            # workspace snapshot: O(pages) API calls instead of one
+            # users.info per member
+            users = self._load_users()
             active_members = []
             for member in members:
-                user_info = self.client.users_info(user=member)['user']
+                user_info = users.get(member)
+                if user_info is None:
+                    # Not in the snapshot (e.g. joined since it was taken)
+                    info = self.users_info(member)
+                    if not info:
+                        continue
+                    user_info = info['user']
                 if not user_info.get('is_bot', False) and not user_info.get('deleted', False):
                     active_members.append(member)
-                
-            logger.info(f"Found {len(active_members)} active members in channel {channel_id}")
+
+            logger.info("Found %d active members in channel %s", len(active_members), channel_id)
             return active_members
-            
+
         except SlackApiError as e:
             logger.error(f"Error getting channel members: {e.response['error']}")
             return []
 
+    def _resolve_channel_id(self, name):
+        """Resolve a channel name to its ID, caching results with a TTL.
+
+        conversations_list is a large paginated (and rate-limited) call
+        that returns the same answer for minutes at a time, so every
+        (name, id) pair seen while paging is warm-filled into the cache
+        and only a miss or expiry hits Slack again.
+        """
+        name = name.lstrip('#')
+        cached = self._channel_id_cache.get(name)
+        if cached and time.monotonic() - cached[1] < self._channel_cache_ttl:
+            return cached[0]
+
+        now = time.monotonic()
+        cursor = None
+        while True:
+            response = self.client.conversations_list(
+                types="public_channel,private_channel",
+                limit=1000,
+                cursor=cursor)
+            for channel in response['channels']:
+                self._channel_id_cache[channel['name']] = (channel['id'], now)
+            cursor = response.get('response_metadata', {}).get('next_cursor')
+            if not cursor:
+                break
+
+        cached = self._channel_id_cache.get(name)
+        return cached[0] if cached else None
+
     def post_weekly_summary(self, user_id, summary):
         """Post weekly summary to the weekly summaries channel"""
         try:
             # Get channel ID first
             try:
-                response = self.client.conversations_list(types="private_channel")
-                channel_id = None
-                for channel in response['channels']:
-                    if channel['name'] == Config.SLACK_WEEKLY_SUMMARY_CHANNEL.lstrip('#'):
-                        channel_id = channel['id']
-                        break
-                
+                self._ensure_in_channels()
+                channel_id = self._resolve_channel_id(
+                    _WEEKLY_CHANNEL)
+
                 if not channel_id:
-                    raise ValueError(f"Channel {Config.SLACK_WEEKLY_SUMMARY_CHANNEL} not found")
+                    raise ValueError(f"Channel {_WEEKLY_CHANNEL} not found")
                 
                 # Post to weekly summaries channel
                 self.client.chat_postMessage(
@@ -405,13 +697,56 @@ class SlackBot:
                     f"Your weekly summary has been generated and posted to <#{channel_id}>:\n\n{summary}"
                 )
                 
-                logger.info(f"Posted weekly summary for user {user_id}")
+                logger.info("Posted weekly summary for user %s", user_id)
             except SlackApiError as e:
                 logger.error(f"Error posting weekly summary: {e.response['error']}")
                 
         except Exception as e:
             logger.error(f"Error in post_weekly_summary: {str(e)}")
 
+    def post_weekly_summary_batch(self, summaries):
+        """Post many users' weekly summaries as combined channel digests.
+
+        summaries is a list of (user_id, summary) pairs. Instead of two
+        posts (plus channel resolution) per user, the whole batch goes
+        out as one section block per user, chunked to stay under Slack's
+        50-blocks-per-message cap — a handful of API calls for the whole
+        team.
+        """
+        try:
+            self._ensure_in_channels()
+            channel_id = self._resolve_channel_id(
+                _WEEKLY_CHANNEL)
+            if not channel_id:
+                raise ValueError(
+                    f"Channel {_WEEKLY_CHANNEL} not found")
+
+            blocks = [
+                {
+                    "type": "section",
+                    "text": {
+                        "type": "mrkdwn",
+                        "text": f"*Weekly Summary for <@{user_id}>*\n\n{summary}"
+                    }
+                }
+                for user_id, summary in summaries
+            ]
+
+            for start in range(0, len(blocks), 50):
+                chunk = blocks[start:start + 50]
+                self._post_limiter.acquire(channel_id)
+                self.client.chat_postMessage(
+                    channel=channel_id,
+                    blocks=chunk,
+                    text="Weekly summaries"  # Fallback text
+                )
+
+            logger.info("Posted weekly summary digest for %d users", len(summaries))
+        except SlackApiError as e:
+            logger.error(f"Error posting weekly summary batch: {e.response['error']}")
+        except Exception as e:
+            logger.error(f"Error in post_weekly_summary_batch: {str(e)}")
+
     def get_user_submission_calendar(self, user_id, year=None):
         """
         Get user's submission history in calendar format
@@ -469,7 +804,7 @@ class SlackBot:
                             'status': 'submitted'
                         }
                 
-                logger.info(f"Found {len(submissions)} submissions for user {user_id} in {year}")
+                logger.info("Found %d submissions for user %s in %s", len(submissions), user_id, year)
             except Exception as e:
                 logger.error(f"Error querying Firebase: {str(e)}")
                 # If the error is about missing index, provide guidance
@@ -504,7 +839,7 @@ class SlackBot:
                                     'status': 'submitted'
                                 }
                         
-                        logger.info(f"Fallback query found {len(submissions)} submissions")
+                        logger.info("Fallback query found %d submissions", len(submissions))
                     except Exception as fallback_error:
                         logger.error(f"Fallback query also failed: {str(fallback_error)}")
             
@@ -566,3 +901,18 @@ class SlackBot:
         except Exception as e:
             logger.error(f"Error fetching user info: {str(e)}")
             return None
+
+# Shared bot instance. Nothing in SlackBot.__init__ is per-caller, so Flask
+# routes and scheduler jobs can reuse one client (and its user-info cache)
+# instead of rebuilding the WebClient and rejoining channels per event.
+_instance = None
+
+
+def get_bot():
+    """Return the shared SlackBot, creating it on first use"""
+    global _instance
+    if _instance is None:
+        _instance = SlackBot()
+        if Config.SLACK_BOT_TOKEN:
+            _instance.client.token = Config.SLACK_BOT_TOKEN
+    return _instance
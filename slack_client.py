@@ -1,18 +1,184 @@
 from slack_sdk import WebClient
+from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# User profiles rarely change; cache lifetimes scale with how long the
+# fetch took — a slow (throttled or struggling) Slack gets re-hit less —
+# clamped between 10 minutes and an hour
+_MIN_TTL = 600
+_MAX_TTL = 3600
+_TTL_BUFFER = 30
+_TTL_FACTOR = 10
+
+
+def _entry_ttl(elapsed):
+    """Freshness lifetime for a cache entry, scaled from fetch latency"""
+    return max(_MIN_TTL, min(_MAX_TTL, elapsed * _TTL_FACTOR + _TTL_BUFFER))
+
+
+# Known-bad IDs (deactivated contractors still on a poll list) are cached
+# as None for a short while so they don't re-hit the API every cycle
+_NEGATIVE_TTL = 300
+
+# The cache lives at module level so every SlackClient in the process
+# shares one copy — callers construct throwaway instances (e.g. per
+# report save), and a per-instance cache would never get a hit there
+_user_cache = {}  # user_id -> (cached_at, user dict, ttl)
+_cache_lock = threading.Lock()
+_list_lock = threading.Lock()  # One users.list pager at a time
+
+# Shared pool for overlapping blocking lookups; threads are only spawned
+# once get_user_info_async is actually used
+_executor = ThreadPoolExecutor(max_workers=8,
+                               thread_name_prefix='slack-client')
+
 
 class SlackClient:
+    # One WebClient per token per process: call sites construct throwaway
+    # SlackClients, and sharing the underlying client (and its SSL
+    # context) makes those constructions nearly free
+    _clients = {}
+    _clients_lock = threading.Lock()
+
     def __init__(self, token):
-        self.client = WebClient(token=token)
-        
+        with SlackClient._clients_lock:
+            client = SlackClient._clients.get(token)
+            if client is None:
+                # Bounded Retry-After-aware retries so a transient 429
+                # doesn't immediately surface as a failed lookup
+                client = WebClient(
+                    token=token,
+                    retry_handlers=[RateLimitErrorRetryHandler(max_retry_count=2)])
+                SlackClient._clients[token] = client
+        self.client = client
+        self._user_cache = _user_cache
+        self._cache_lock = _cache_lock
+        self._list_lock = _list_lock
+
+    def get_user_info_async(self, user_id):
+        """Run get_user_info on the shared pool; returns a Future.
+
+        Lets callers overlap several blocking lookups (future.result()
+        to collect) without converting their call graph to asyncio.
+        """
+        return _executor.submit(self.get_user_info, user_id)
+
+    def _cached_entry(self, user_id, now):
+        """Return the fresh cache entry for user_id, else None.
+
+        A fresh entry may carry a None user dict — the negative-cache
+        sentinel for IDs Slack said don't exist.
+        """
+        cached = self._user_cache.get(user_id)
+        if cached and now - cached[0] < cached[2]:
+            return cached
+        return None
+
+    def get_users_bulk(self, user_ids):
+        """Resolve many users at once via paginated users.list.
+
+        One list page covers up to 200 users, so resolving a team costs
+        O(pages) API calls instead of one users.info per member. Every
+        user seen while paging is warm-filled into the cache, paging
+        stops early once all requested IDs are found, and concurrent
+        callers serialize on the pager so only one list runs at a time.
+        Returns {user_id: user} for the requested IDs that resolved.
+        """
+        wanted = set(user_ids)
+        resolved = {}
+
+        def _take_from_cache():
+            now = time.time()
+            with self._cache_lock:
+                for uid in list(wanted):
+                    entry = self._cached_entry(uid, now)
+                    if entry is not None:
+                        # Fresh negatives leave the ID out of resolved but
+                        # also out of the page scan
+                        if entry[1] is not None:
+                            resolved[uid] = entry[1]
+                        wanted.discard(uid)
+
+        _take_from_cache()
+        if not wanted:
+            return resolved
+
+        with self._list_lock:
+            # A concurrent caller may have just filled the cache while we
+            # waited for the pager
+            _take_from_cache()
+            if not wanted:
+                return resolved
+            try:
+                cursor = None
+                while True:
+                    t0 = time.monotonic()
+                    response = self.client.users_list(limit=200, cursor=cursor)
+                    ttl = _entry_ttl(time.monotonic() - t0)
+                    now = time.time()
+                    with self._cache_lock:
+                        for user in response['members']:
+                            self._user_cache[user['id']] = (now, user, ttl)
+                            if user['id'] in wanted:
+                                resolved[user['id']] = user
+                                wanted.discard(user['id'])
+                    if not wanted:
+                        break
+                    cursor = response.get('response_metadata', {}).get('next_cursor')
+                    if not cursor:
+                        break
+            except Exception as e:
+                logger.error(f"Error listing users from Slack: {str(e)}")
+        return resolved
+
+    def warm_cache(self, user_ids):
+        """Prefill the user cache for a batch of IDs via the bulk path.
+
+        Meant to be called once at the start of a fan-out (scheduler
+        tick, tracker rebuild) so the per-user get_user_info calls that
+        follow are dict lookups instead of API round-trips.
+        """
+        self.get_users_bulk(user_ids)
+
     def get_user_info(self, user_id):
         """Get user information from Slack"""
+        with self._cache_lock:
+            cached = self._user_cache.get(user_id)
+        if cached and time.time() - cached[0] < cached[2]:
+            return cached[1]
+
         try:
+            t0 = time.monotonic()
+            # The SDK raises SlackApiError for non-ok responses, so a
+            # returned response is always the success shape
             response = self.client.users_info(user=user_id)
-            if response['ok']:
-                return response['user']
-            else:
-                logger.error(f"Error getting user info from Slack: {response.get('error')}")
-                return None
+            elapsed = time.monotonic() - t0
+            user = response['user']
+            with self._cache_lock:
+                self._user_cache[user_id] = (time.time(), user, _entry_ttl(elapsed))
+            return user
+        except SlackApiError as e:
+            error = e.response.get('error')
+            if error == 'ratelimited' and cached:
+                # Retries exhausted; a stale profile beats blocking the
+                # caller or returning nothing
+                logger.warning("users.info rate-limited; serving stale info for %s", user_id)
+                return cached[1]
+            if error == 'user_not_found':
+                # Negative-cache the miss so a deactivated contractor on
+                # a poll list doesn't cost an API call every cycle
+                with self._cache_lock:
+                    self._user_cache[user_id] = (time.time(), None, _NEGATIVE_TTL)
+            # API errors are expected operational noise (bad IDs,
+            # throttling); log the Slack error code, not a traceback
+            logger.warning("users.info failed for %s: %s", user_id, error)
+            return None
         except Exception as e:
             logger.error(f"Error getting user info from Slack: {str(e)}")
-            return None 
\ No newline at end of file
+            return None